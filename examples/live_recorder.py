@@ -2,7 +2,6 @@
 
 import logging
 import wave
-import struct
 import os
 import sys
 
@@ -74,8 +73,9 @@ while True:
     samples = rec.get_samples()
 
     audio, finalize = vad.process_audio(samples)
+    rec.release(samples)
 
-    if not audio:
+    if audio is None:
         continue
 
     logging.debug ("%8d got audio. finalize: %s" % (cnt, repr(finalize)))
@@ -104,8 +104,7 @@ while True:
 
         logging.info('voice activity detected, recording to: %s' % audiofn)
 
-    packed_audio = struct.pack('%sh' % len(audio), *audio)
-    wfs.writeframes(packed_audio)
+    wfs.writeframes(audio.tobytes())
 
     if finalize:
 
@@ -22,8 +22,9 @@ while True:
     samples = rec.get_samples()
 
     audio, finalize = vad.process_audio(samples)
+    rec.release(samples)
 
-    if not audio:
+    if audio is None:
         continue
 
     user_utt, confidence = asr.decode(audio, finalize)
@@ -49,7 +49,8 @@ print ("Please speak. (CTRL-C to exit)")
 while True:
     samples = rec.get_samples()
     audio, finalize = vad.process_audio(samples)
-    if not audio:
+    rec.release(samples)
+    if audio is None:
         continue
 
     user_utt, c = asr.decode(audio, finalize)
@@ -28,10 +28,14 @@ import time
 import re
 import struct
 import wave
+import multiprocessing
 import numpy as np
 
+from threading          import Lock, Condition
+
 from base64             import b64encode
 from kaldiasr.nnet3     import KaldiNNet3OnlineModel, KaldiNNet3OnlineDecoder
+from nltools.wavfile    import mmap_wav
 
 ASR_ENGINE_NNET3        = 'kaldi-nnet3'
 ASR_ENGINE_POCKETSPHINX = 'pocketsphinx'
@@ -41,11 +45,91 @@ DEFAULT_MODEL_DIR       = 'models/kaldi-generic-en-tdnn_sp-latest'
 DEFAULT_MODEL_NAME      = 'model'
 DEFAULT_STREAM_ID       = '__default__'
 DEFAULT_SAMPLE_RATE     = 16000
+DEFAULT_CHUNK_LENGTH    = 0.5 # seconds, streaming wav file decoding
 
 DEFAULT_KALDI_BEAM                      = 7.0 # nnet3: 15.0
 DEFAULT_KALDI_ACOUSTIC_SCALE            = 1.0 # nnet3:  0.1
 DEFAULT_KALDI_FRAME_SUBSAMPLING_FACTOR  = 3   # nnet3:  1
 
+#
+# decoder sessions: a decoder is bound to a stream id for the duration of
+# one utterance. On finalize it goes back to a pool of free decoders (at
+# most MAX_FREE_DECODERS are kept) and is reused by the next utterance of
+# any stream. Streams without audio for idle_timeout seconds are evicted
+# (checked every EVICT_INTERVAL seconds), close_stream() releases a stream
+# explicitly.
+#
+# max_streams limits the number of concurrent streams: decode() on a new
+# stream then blocks until another stream finishes, waiting stream_wait
+# seconds at most. Sessions are managed under a lock, so different streams
+# can be decoded from different threads; calls for the same stream must
+# not overlap.
+#
+
+DEFAULT_IDLE_TIMEOUT    = 60   # seconds
+DEFAULT_MAX_STREAMS     = None # unlimited
+DEFAULT_STREAM_WAIT     = 10.0 # seconds
+MAX_FREE_DECODERS       = 4
+EVICT_INTERVAL          = 1    # seconds
+
+#
+# batch decoding: decode_wav_files() decodes wav files in a pool of worker
+# processes. Each worker loads its own copy of the model once (the kaldi
+# and pocketsphinx models cannot be pickled or shared), then only file
+# names and results travel between the processes.
+#
+
+_worker_asr = None
+
+def _init_worker (kwargs):
+    global _worker_asr
+    _worker_asr = ASR(**kwargs)
+
+def _decode_wav_worker (wavfile):
+    return _worker_asr._decode_wav_timed(wavfile)
+
+#
+# decode() accepts audio as numpy arrays (int16 or float32), bytes,
+# bytearrays or memoryviews (16 bit little endian PCM) or sequences of
+# samples. Arrays in the format the engine wants are passed through as
+# they are, everything else is converted at most once.
+#
+
+def _audio_int16 (buf):
+
+    # zero-copy int16 view of a PCM buffer
+    # (numpy on python 2 cannot frombuffer() memoryviews)
+
+    if isinstance(buf, memoryview):
+        return np.asarray(buf).view('<i2')
+    return np.frombuffer(buf, dtype='<i2')
+
+def _audio_float32 (audio):
+
+    # kaldi: C contiguous float32 array
+
+    if isinstance(audio, np.ndarray):
+        if audio.dtype == np.float32 and audio.flags.c_contiguous:
+            return audio
+        return audio.astype(np.float32, order='C')
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        return _audio_int16(audio).astype(np.float32)
+    return np.array(audio, dtype=np.float32)
+
+def _audio_pcm (audio):
+
+    # pocketsphinx: 16 bit little endian PCM bytes
+
+    if isinstance(audio, bytes):
+        return audio
+    if isinstance(audio, memoryview):
+        return audio.tobytes()
+    if isinstance(audio, bytearray):
+        return bytes(audio)
+    if not isinstance(audio, np.ndarray):
+        return struct.pack('<%dh' % len(audio), *audio)
+    return audio.astype('<i2', copy=False).tobytes()
+
 class ASR(object):
 
     def __init__(self, 
@@ -56,12 +140,35 @@ class ASR(object):
                  kaldi_beam                     = DEFAULT_KALDI_BEAM,
                  kaldi_acoustic_scale           = DEFAULT_KALDI_ACOUSTIC_SCALE, 
                  kaldi_frame_subsampling_factor = DEFAULT_KALDI_FRAME_SUBSAMPLING_FACTOR, 
+
+                 idle_timeout = DEFAULT_IDLE_TIMEOUT,
+                 max_streams  = DEFAULT_MAX_STREAMS,
+                 stream_wait  = DEFAULT_STREAM_WAIT,
                 ):
 
         self._engine      = engine
         self._model_dir   = model_dir
         self._model_name  = model_name
-        self.asr_decoders = {} # stream_id -> decoder
+        self.asr_decoders = {}    # stream_id -> decoder, streams within an utterance
+        self.free_decoders = []   # finalized decoders for reuse
+        self.last_seen    = {}    # stream_id -> time of last decode
+        self.decoding     = set() # stream_ids with a decode() in progress
+        self.last_evict   = None
+
+        self.idle_timeout = idle_timeout
+        self.max_streams  = max_streams
+        self.stream_wait  = stream_wait
+
+        self.lock         = Lock()
+        self.cond         = Condition(self.lock)
+
+        # constructor arguments, used to set up worker processes
+        self._kwargs      = { 'engine'                         : engine,
+                              'model_dir'                      : model_dir,
+                              'model_name'                     : model_name,
+                              'kaldi_beam'                     : kaldi_beam,
+                              'kaldi_acoustic_scale'           : kaldi_acoustic_scale,
+                              'kaldi_frame_subsampling_factor' : kaldi_frame_subsampling_factor }
 
         if self._engine == ASR_ENGINE_NNET3:
 
@@ -115,57 +222,187 @@ class ASR(object):
 
             self.ps_config.set_string('-logfn', "/dev/null")
 
-            self.asr_in_utt = {} # stream_id -> Boolean
-
         else:
             raise Exception ('unknown ASR engine: %s' % self._engine)
 
-    def decode (self, audio, do_finalize, sample_rate = DEFAULT_SAMPLE_RATE, stream_id = DEFAULT_STREAM_ID):
+    def __len__(self):
+        return len(self.asr_decoders)
+
+    def __contains__(self, stream_id):
+        return stream_id in self.asr_decoders
+
+    def _new_decoder (self):
 
         if self._engine == ASR_ENGINE_NNET3:
+            return KaldiNNet3OnlineDecoder (self.nnet3_model)
 
-            if not stream_id in self.asr_decoders:
-                self.asr_decoders[stream_id] = KaldiNNet3OnlineDecoder (self.nnet3_model)
+        import pocketsphinx
+        return pocketsphinx.Decoder(self.ps_config)
 
-            decoder = self.asr_decoders[stream_id]
-            decoder.decode(sample_rate, np.array(audio, dtype=np.float32), do_finalize)
+    def _acquire (self, stream_id, now):
 
-            hstr, confidence = decoder.get_decoded_string()
-            hstr = hstr.strip()
+        # lock held: return the decoder of stream_id, bind a free or new one
+        # to it if it has none
 
-        elif self._engine == ASR_ENGINE_POCKETSPHINX:
+        decoder = self.asr_decoders.get(stream_id)
 
-            if sample_rate != self.ps_samplerate:
-                raise Exception ('decode: samplerate does not match model: %d vs %d' % (sample_rate, self.ps_samplerate))
+        if decoder is None:
+
+            if self.max_streams and len(self.asr_decoders) >= self.max_streams:
+
+                self._evict_idle(now)
 
-            if not stream_id in self.asr_decoders:
-                import pocketsphinx
-                self.asr_decoders[stream_id] = pocketsphinx.Decoder(self.ps_config)
-                self.asr_in_utt[stream_id] = False
+                deadline = time.time() + self.stream_wait
+                while len(self.asr_decoders) >= self.max_streams:
+                    timeout = deadline - time.time()
+                    if timeout <= 0:
+                        raise Exception ('decode: max streams (%d) reached' % self.max_streams)
+                    self.cond.wait(timeout)
 
-            decoder = self.asr_decoders[stream_id]
-            if not self.asr_in_utt[stream_id]:
+            if self.free_decoders:
+                decoder = self.free_decoders.pop()
+            else:
+                decoder = self._new_decoder()
+
+            if self._engine == ASR_ENGINE_POCKETSPHINX:
                 decoder.start_utt()
-                self.asr_in_utt[stream_id] = True
 
-            audios = struct.pack('<%dh' % len(audio), *audio)
+            self.asr_decoders[stream_id] = decoder
+
+        self.last_seen[stream_id] = now
+
+        return decoder
+
+    def _release (self, stream_id, finalized, discard=False):
+
+        # lock held: unbind stream_id's decoder, keep it for reuse if its
+        # utterance is complete
+
+        decoder = self.asr_decoders.pop(stream_id)
+        del self.last_seen[stream_id]
 
-            decoder.process_raw(audios, False, False)
+        self.cond.notify()
 
-            if not do_finalize:
-                return None, 0.0
+        if discard:
+            return
 
+        if not finalized and self._engine == ASR_ENGINE_POCKETSPHINX:
             decoder.end_utt()
-            self.asr_in_utt[stream_id] = False
+            finalized = True
 
-            hypothesis = decoder.hyp()
-            logmath = decoder.get_logmath()
-            hstr = hypothesis.hypstr.decode('utf8').strip()
-            confidence = logmath.exp(hypothesis.prob)
+        # kaldi decoders cannot be reset mid-utterance, those are dropped
+        if finalized and len(self.free_decoders) < MAX_FREE_DECODERS:
+            self.free_decoders.append(decoder)
 
-        else:
+    def _evict_idle (self, now):
+
+        self.last_evict = now
+
+        evicted = []
+
+        for stream_id, last_seen in list(self.last_seen.items()):
+            if now - last_seen >= self.idle_timeout and not stream_id in self.decoding:
+                logging.debug ('ASR: evicting idle stream %s' % repr(stream_id))
+                self._release(stream_id, False)
+                evicted.append(stream_id)
+
+        return evicted
+
+    def evict_idle (self, now=None):
+
+        # release streams idle for idle_timeout seconds, returns their ids
+
+        if now is None:
+            now = time.time()
+
+        self.lock.acquire()
+        try:
+            return self._evict_idle(now)
+        finally:
+            self.lock.release()
+
+    def open_stream (self, stream_id):
+
+        # bind a decoder to stream_id now, blocking while max_streams are
+        # active. Optional, decode() does this on the first chunk.
+
+        self.lock.acquire()
+        try:
+            self._acquire(stream_id, time.time())
+        finally:
+            self.lock.release()
+
+    def close_stream (self, stream_id):
+
+        # discard stream_id's decoder state, e.g. when a client disconnects
+
+        self.lock.acquire()
+        try:
+            if stream_id in self.asr_decoders:
+                self._release(stream_id, False)
+        finally:
+            self.lock.release()
+
+    def decode (self, audio, do_finalize, sample_rate = DEFAULT_SAMPLE_RATE, stream_id = DEFAULT_STREAM_ID):
+
+        if self._engine == ASR_ENGINE_POCKETSPHINX:
+            if sample_rate != self.ps_samplerate:
+                raise Exception ('decode: samplerate does not match model: %d vs %d' % (sample_rate, self.ps_samplerate))
+
+        elif self._engine != ASR_ENGINE_NNET3:
             raise Exception ('unknown ASR engine: %s' % self._engine)
 
+        now = time.time()
+
+        self.lock.acquire()
+        try:
+            if self.last_evict is None or now - self.last_evict >= EVICT_INTERVAL:
+                self._evict_idle(now)
+
+            decoder = self._acquire(stream_id, now)
+            self.decoding.add(stream_id)
+        finally:
+            self.lock.release()
+
+        try:
+            if self._engine == ASR_ENGINE_NNET3:
+
+                decoder.decode(sample_rate, _audio_float32(audio), do_finalize)
+
+                hstr, confidence = decoder.get_decoded_string()
+                hstr = hstr.strip()
+
+            else:
+
+                decoder.process_raw(_audio_pcm(audio), False, False)
+
+                if do_finalize:
+
+                    decoder.end_utt()
+
+                    hypothesis = decoder.hyp()
+                    logmath = decoder.get_logmath()
+                    hstr = hypothesis.hypstr.decode('utf8').strip()
+                    confidence = logmath.exp(hypothesis.prob)
+
+                else:
+                    hstr, confidence = None, 0.0
+
+        except:
+            # decoder state is unknown, do not reuse it
+            self.lock.acquire()
+            self.decoding.discard(stream_id)
+            if stream_id in self.asr_decoders:
+                self._release(stream_id, False, discard=True)
+            self.lock.release()
+            raise
+
+        self.lock.acquire()
+        self.decoding.discard(stream_id)
+        if do_finalize and stream_id in self.asr_decoders:
+            self._release(stream_id, True)
+        self.lock.release()
+
         return hstr, confidence
 
 
@@ -190,7 +427,7 @@ class ASR(object):
     # def model_name(self, v):
     #     self._model_name = v
 
-    def decode_wav_file(self, wavfile):
+    def _read_wav(self, wavfile):
 
         wavf = wave.open(wavfile, 'rb')
 
@@ -205,9 +442,99 @@ class ASR(object):
         num_frames = wavf.getnframes()
         frames = wavf.readframes(num_frames)
 
-        samples = struct.unpack_from('<%dh' % num_frames, frames)
-
         wavf.close()
 
+        return np.frombuffer(frames, dtype='<i2'), sample_rate
+
+    def decode_wav_file(self, wavfile, chunk_length=None):
+
+        # chunk_length (seconds): decode in chunks from a memory mapped file,
+        # in constant memory
+
+        if chunk_length:
+            for hstr, confidence, final in self.decode_wav_stream(wavfile, chunk_length):
+                pass
+            return hstr, confidence
+
+        samples, sample_rate = self._read_wav(wavfile)
+
         return self.decode(samples, True, sample_rate)
 
+    def decode_wav_stream(self, wavfile, chunk_length=DEFAULT_CHUNK_LENGTH, partial=False, stream_id=DEFAULT_STREAM_ID):
+
+        # streaming decode of (long) wav files: the samples are memory mapped
+        # and fed to the decoder chunk_length seconds at a time, so only one
+        # chunk is held in memory. Yields (hstr, confidence, final) tuples,
+        # the final hypothesis only unless partial=True (kaldi only,
+        # pocketsphinx has no partial results).
+
+        samples, sample_rate = mmap_wav(wavfile)
+
+        num_frames = len(samples)
+        if not num_frames:
+            raise Exception ('%s: no audio' % wavfile)
+
+        chunk_frames = max(1, int(chunk_length * sample_rate))
+
+        # the generator may be abandoned or decode() may fail mid-file:
+        # do not leave a half decoded utterance behind on stream_id
+
+        finalized = False
+
+        try:
+            for start in range(0, num_frames, chunk_frames):
+
+                chunk    = samples[start:start+chunk_frames]
+                finalize = start + chunk_frames >= num_frames
+
+                hstr, confidence = self.decode(chunk, finalize, sample_rate, stream_id)
+
+                if finalize:
+                    finalized = True
+                    yield hstr, confidence, True
+                elif partial and hstr is not None:
+                    yield hstr, confidence, False
+
+        finally:
+            if not finalized:
+                self.close_stream(stream_id)
+
+    def _decode_wav_timed(self, wavfile):
+
+        start_time = time.time()
+
+        try:
+            hstr, confidence = self.decode_wav_file(wavfile)
+        except Exception as e:
+            logging.error ('%s: %s' % (wavfile, e))
+            hstr, confidence = None, 0.0
+
+        return wavfile, hstr, confidence, time.time() - start_time
+
+    def decode_wav_files(self, wavfiles, workers=None):
+
+        # decode a list of wav files, yields (wavfile, hstr, confidence, decode time)
+        # tuples in completion order. hstr is None for files that failed to decode.
+
+        if not workers:
+            workers = multiprocessing.cpu_count()
+
+        wavfiles = list(wavfiles)
+
+        if workers == 1 or len(wavfiles) < 2:
+            for wavfile in wavfiles:
+                yield self._decode_wav_timed(wavfile)
+            return
+
+        pool = multiprocessing.Pool(min(workers, len(wavfiles)), _init_worker, (self._kwargs,))
+
+        try:
+            for res in pool.imap_unordered(_decode_wav_worker, wavfiles):
+                yield res
+
+            pool.close()
+
+        finally:
+            pool.terminate()
+            pool.join()
+
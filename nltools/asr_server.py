@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# Copyright 2018 Guenter Bartsch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# nltools-asr-server: share one loaded ASR model between many processes
+#
+# a small HTTP server around ASR: clients POST chunks of 16 bit little
+# endian mono PCM audio tagged by stream id, the server decodes them with
+# one shared model and per-stream decoders and returns the (partial or
+# final) hypothesis as JSON:
+#
+# POST /decode?stream_id=<id>&finalize=<0|1>&sample_rate=<rate>  (body: PCM)
+#      -> {"hstr": <hypothesis or null>, "confidence": <float>, "final": <bool>}
+# POST /close?stream_id=<id>
+#      -> {}
+#
+# errors are reported as {"error": <message>} with status 500.
+#
+# every connection is served by a thread of its own (HTTP/1.1 keep-alive),
+# decode() calls run on at most <workers> of them at a time. Chunks of the
+# same stream are decoded in order, streams waiting for a free decoder
+# (ASR max_streams) do not occupy a worker.
+#
+# ASRClient mirrors ASR.decode() / ASR.close_stream(), so it can be used in
+# place of a local ASR instance.
+#
+
+import sys
+import json
+import errno
+import socket
+import logging
+import multiprocessing
+
+from optparse           import OptionParser
+from threading          import Lock, Semaphore
+
+try:
+    from http.server    import BaseHTTPRequestHandler, HTTPServer
+    from http.client    import HTTPConnection, BadStatusLine
+    from socketserver   import ThreadingMixIn
+    from urllib.parse   import urlparse, parse_qs, urlencode
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from httplib        import HTTPConnection, BadStatusLine
+    from SocketServer   import ThreadingMixIn
+    from urlparse       import urlparse, parse_qs
+    from urllib         import urlencode
+
+from nltools.asr        import ASR, _audio_pcm, ASR_ENGINE_NNET3, ASR_ENGINE_POCKETSPHINX, DEFAULT_ENGINE, \
+                               DEFAULT_MODEL_DIR, DEFAULT_MODEL_NAME, DEFAULT_STREAM_ID, DEFAULT_SAMPLE_RATE, \
+                               DEFAULT_IDLE_TIMEOUT
+
+DEFAULT_HOST    = 'localhost'
+DEFAULT_PORT    = 8301
+DEFAULT_TIMEOUT = 60 # seconds, client
+
+class ASRRequestHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self, code, res):
+
+        body = json.dumps(res).encode('utf8')
+
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+
+        url       = urlparse(self.path)
+        params    = parse_qs(url.query)
+        audio     = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        stream_id = params.get('stream_id', [DEFAULT_STREAM_ID])[0]
+
+        try:
+            if url.path == '/decode':
+
+                finalize    = params.get('finalize', ['0'])[0] in ('1', 'true')
+                sample_rate = int(params.get('sample_rate', [DEFAULT_SAMPLE_RATE])[0])
+
+                hstr, confidence = self.server.decode(audio, finalize, sample_rate, stream_id)
+
+                self._reply(200, {'hstr': hstr, 'confidence': float(confidence), 'final': finalize})
+
+            elif url.path == '/close':
+
+                self.server.close_stream(stream_id)
+
+                self._reply(200, {})
+
+            else:
+                self._reply(404, {'error': 'unknown path: %s' % url.path})
+
+        except Exception as e:
+            logging.error('ASRServer: %s: %s' % (repr(stream_id), e))
+            self._reply(500, {'error': str(e)})
+
+    def log_message(self, format, *args):
+        logging.debug('ASRServer: %s %s' % (self.address_string(), format % args))
+
+class ASRServer(ThreadingMixIn, HTTPServer):
+
+    daemon_threads      = True
+    allow_reuse_address = True
+
+    def __init__(self, asr, host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None):
+
+        HTTPServer.__init__(self, (host, port), ASRRequestHandler)
+
+        self.asr          = asr
+        self.workers      = Semaphore(workers or multiprocessing.cpu_count())
+        self.lock         = Lock()
+        self.stream_locks = {} # stream_id -> [lock, number of users]
+
+    def _lock_stream(self, stream_id):
+
+        self.lock.acquire()
+        entry = self.stream_locks.get(stream_id)
+        if not entry:
+            entry = [Lock(), 0]
+            self.stream_locks[stream_id] = entry
+        entry[1] += 1
+        self.lock.release()
+
+        entry[0].acquire()
+
+    def _unlock_stream(self, stream_id):
+
+        self.lock.acquire()
+        entry = self.stream_locks[stream_id]
+        entry[0].release()
+        entry[1] -= 1
+        if not entry[1]:
+            del self.stream_locks[stream_id]
+        self.lock.release()
+
+    def decode(self, audio, do_finalize, sample_rate, stream_id):
+
+        self._lock_stream(stream_id)
+        try:
+            # wait for a decoder before taking a worker
+            self.asr.open_stream(stream_id)
+
+            self.workers.acquire()
+            try:
+                return self.asr.decode(audio, do_finalize, sample_rate, stream_id)
+            finally:
+                self.workers.release()
+
+        finally:
+            self._unlock_stream(stream_id)
+
+    def close_stream(self, stream_id):
+
+        self._lock_stream(stream_id)
+        try:
+            self.asr.close_stream(stream_id)
+        finally:
+            self._unlock_stream(stream_id)
+
+def _connection_closed (e):
+
+    # BadStatusLine: closed before sending a response (RemoteDisconnected
+    # on python 3), EPIPE: closed while we were sending
+
+    if isinstance(e, socket.timeout):
+        return False
+    if isinstance(e, BadStatusLine):
+        return True
+    return isinstance(e, socket.error) and e.errno == errno.EPIPE
+
+class ASRClient(object):
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, timeout=DEFAULT_TIMEOUT):
+
+        self.host    = host
+        self.port    = port
+        self.timeout = timeout
+        self.conn    = None
+
+    def _post(self, path, params, body=b''):
+
+        while True:
+
+            fresh = self.conn is None
+            if fresh:
+                self.conn = HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+            try:
+                self.conn.request('POST', '%s?%s' % (path, urlencode(params)), body,
+                                  {'Content-Type': 'application/octet-stream'})
+                resp = self.conn.getresponse()
+                res  = json.loads(resp.read().decode('utf8'))
+                break
+
+            except Exception as e:
+                self.close()
+
+                # retry once if the server has closed an idle keep-alive
+                # connection: it did not receive the request then. Anything
+                # else (timeouts in particular) may have been decoded
+                # already, retrying could feed the audio twice.
+
+                if fresh or not _connection_closed(e):
+                    raise
+
+        if resp.status != 200:
+            raise Exception ('ASRServer: %s' % res.get('error'))
+
+        return res
+
+    def decode(self, audio, do_finalize, sample_rate = DEFAULT_SAMPLE_RATE, stream_id = DEFAULT_STREAM_ID):
+
+        res = self._post('/decode', {'stream_id': stream_id, 'finalize': int(bool(do_finalize)), 'sample_rate': sample_rate},
+                         _audio_pcm(audio))
+
+        return res['hstr'], res['confidence']
+
+    def close_stream(self, stream_id):
+        self._post('/close', {'stream_id': stream_id})
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+def main (argv=None):
+
+    parser = OptionParser("usage: %prog [options]")
+
+    parser.add_option ("-e", "--engine", dest="engine", type="str", default=DEFAULT_ENGINE,
+                       help="ASR engine, %s or %s (default: %s)" % (ASR_ENGINE_NNET3, ASR_ENGINE_POCKETSPHINX, DEFAULT_ENGINE))
+
+    parser.add_option ("-d", "--model-dir", dest="model_dir", type="str", default=DEFAULT_MODEL_DIR,
+                       help="model directory (default: %s)" % DEFAULT_MODEL_DIR)
+
+    parser.add_option ("-n", "--model-name", dest="model_name", type="str", default=DEFAULT_MODEL_NAME,
+                       help="model name (default: %s)" % DEFAULT_MODEL_NAME)
+
+    parser.add_option ("-H", "--host", dest="host", type="str", default=DEFAULT_HOST,
+                       help="address to listen on (default: %s)" % DEFAULT_HOST)
+
+    parser.add_option ("-p", "--port", dest="port", type="int", default=DEFAULT_PORT,
+                       help="port to listen on (default: %d)" % DEFAULT_PORT)
+
+    parser.add_option ("-w", "--workers", dest="workers", type="int", default=0,
+                       help="number of concurrent decodes (default: number of cpus)")
+
+    parser.add_option ("-s", "--max-streams", dest="max_streams", type="int", default=0,
+                       help="max number of concurrent streams (default: unlimited)")
+
+    parser.add_option ("-i", "--idle-timeout", dest="idle_timeout", type="float", default=DEFAULT_IDLE_TIMEOUT,
+                       help="close streams idle for this many seconds (default: %s)" % DEFAULT_IDLE_TIMEOUT)
+
+    parser.add_option ("-v", "--verbose", action="store_true", dest="verbose",
+                       help="enable verbose logging")
+
+    (options, args) = parser.parse_args(argv)
+
+    if options.verbose:
+        logging.basicConfig(level=logging.DEBUG)
+    else:
+        logging.basicConfig(level=logging.INFO)
+
+    asr = ASR(engine       = options.engine,
+              model_dir    = options.model_dir,
+              model_name   = options.model_name,
+              idle_timeout = options.idle_timeout,
+              max_streams  = options.max_streams or None)
+
+    server = ASRServer(asr, options.host, options.port, options.workers)
+
+    logging.info('ASR server listening on %s:%d' % server.server_address[:2])
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    return 0
+
+if __name__ == "__main__":
+
+    sys.exit(main())
@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# Copyright 2018 Guenter Bartsch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# FileRecorder: stand-in for PulseRecorder which replays audio from files
+#
+# sources are wav files, directories (searched for *.wav recursively) and
+# raw 16 bit little endian mono PCM files or pipes ('-' for stdin), played
+# back in order as one continuous recording. Audio is delivered in buffers
+# of frames_per_buffer samples, either as fast as possible or paced in
+# real time.
+#
+# get_samples() raises EOFError once all sources are exhausted, frames()
+# simply stops. Like with PulseRecorder, frames() supports both blocking and
+# (python 3.5+) async iteration.
+#
+
+import os
+import io
+import sys
+import time
+import wave
+import logging
+
+import numpy as np
+
+from nltools.vad import BUFFER_DURATION
+
+# same values as in nltools.pulserecorder
+MIX_MODE_BOTH             = 0
+MIX_MODE_LEFT             = 1
+MIX_MODE_RIGHT            = 2
+
+DEFAULT_RATE              = 16000
+DEFAULT_FRAMES_PER_BUFFER = int(DEFAULT_RATE * BUFFER_DURATION / 1000)
+DEFAULT_MIX_MODE          = MIX_MODE_BOTH
+
+# accepted for compatibility, buffers are read on demand so nothing can
+# overflow
+
+OVERFLOW_DROP_OLDEST      = 0
+OVERFLOW_DROP_NEWEST      = 1
+OVERFLOW_BLOCK            = 2
+
+DEFAULT_MAX_BUFFERS       = 1000
+DEFAULT_OVERFLOW          = OVERFLOW_DROP_OLDEST
+
+#
+# RecorderFrames: same interface as nltools.pulserecorder.RecorderFrames.
+# Buffers are read in the event loop's default executor when iterated
+# asynchronously, as reading (and real time pacing) blocks.
+#
+
+class RecorderFrames(object):
+
+    def __init__(self, recorder):
+        self.recorder = recorder
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return self.recorder.get_samples()
+        except EOFError:
+            raise StopIteration
+
+    next = __next__
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        fut  = loop.create_future()
+
+        def done(f):
+            if fut.cancelled():
+                return
+            if f.cancelled():
+                fut.cancel()
+            elif isinstance(f.exception(), EOFError):
+                fut.set_exception(StopAsyncIteration())
+            elif f.exception():
+                fut.set_exception(f.exception())
+            else:
+                fut.set_result(f.result())
+
+        loop.run_in_executor(None, self.recorder.get_samples).add_done_callback(done)
+
+        return fut
+
+class FileRecorder(object):
+
+    def __init__(self, sources, rate=DEFAULT_RATE, realtime=False):
+
+        if not isinstance(sources, (list, tuple)):
+            sources = [sources]
+
+        self.sources     = sources
+        self.rate        = rate
+        self.realtime    = realtime
+        self.source_name = ''
+
+        self._recording  = False
+
+    def _expand_sources(self):
+
+        fns = []
+
+        for source in self.sources:
+
+            if not os.path.isdir(source):
+                fns.append(source)
+                continue
+
+            for dirpath, dirnames, filenames in os.walk(source):
+                dirnames.sort()
+                for fn in sorted(filenames):
+                    if fn.lower().endswith('.wav'):
+                        fns.append(os.path.join(dirpath, fn))
+
+        return fns
+
+    def start_recording(self, frames_per_buffer = DEFAULT_FRAMES_PER_BUFFER, mix_mode = DEFAULT_MIX_MODE,
+                        max_buffers = DEFAULT_MAX_BUFFERS, overflow = DEFAULT_OVERFLOW):
+
+        logging.debug("start_recording...")
+
+        self._frames_per_buffer = frames_per_buffer
+        self._mix_mode          = mix_mode
+        self._fns               = self._expand_sources()
+        self._wavf              = None
+        self._rawf              = None
+        self._start_time        = time.time()
+        self._buf_cnt           = 0
+        self._recording         = True
+
+    def stop_recording(self):
+
+        logging.debug("stop_recording...")
+
+        self._close_source()
+        self._recording = False
+
+    def _open_source(self):
+
+        fn = self._fns.pop(0)
+
+        logging.debug('FileRecorder: replaying %s' % fn)
+
+        self.source_name = fn
+
+        if fn == '-':
+            self._rawf = getattr(sys.stdin, 'buffer', sys.stdin)
+
+        elif fn.lower().endswith('.wav'):
+
+            self._wavf = wave.open(fn, 'rb')
+
+            if self._wavf.getsampwidth() != 2:
+                raise Exception ('%s: 16 bit samples expected' % fn)
+            if self._wavf.getframerate() != self.rate:
+                raise Exception ('%s: sample rate %d, %d expected' % (fn, self._wavf.getframerate(), self.rate))
+
+        else:
+            self._rawf = io.open(fn, 'rb')
+
+    def _close_source(self):
+
+        if self._wavf:
+            self._wavf.close()
+        if self._rawf and self.source_name != '-':
+            self._rawf.close()
+
+        self._wavf = None
+        self._rawf = None
+
+    def _read(self, num_samples):
+
+        # read up to num_samples mono samples from the current source
+
+        if self._wavf:
+
+            channels = self._wavf.getnchannels()
+            data     = self._wavf.readframes(num_samples)
+            samples  = np.frombuffer(data, dtype='<i2')
+            samples  = samples[:len(samples) - len(samples) % channels].reshape(-1, channels)
+
+            if channels == 1:
+                return samples[:, 0]
+            if self._mix_mode == MIX_MODE_LEFT:
+                return samples[:, 0]
+            if self._mix_mode == MIX_MODE_RIGHT:
+                return samples[:, 1]
+            return samples.mean(axis=1).astype(np.int16)
+
+        data = self._rawf.read(num_samples * 2)
+        return np.frombuffer(data[:len(data) - len(data) % 2], dtype='<i2')
+
+    def get_samples(self):
+
+        if not self._recording:
+            raise EOFError ('FileRecorder: not recording')
+
+        buf = np.zeros(self._frames_per_buffer, dtype=np.int16)
+        cnt = 0
+
+        while cnt < self._frames_per_buffer:
+
+            if not self._wavf and not self._rawf:
+                if not self._fns:
+                    break
+                self._open_source()
+
+            samples = self._read(self._frames_per_buffer - cnt)
+
+            if not len(samples):
+                self._close_source()
+                continue
+
+            buf[cnt:cnt+len(samples)] = samples
+            cnt += len(samples)
+
+        if not cnt:
+            raise EOFError ('FileRecorder: end of input')
+
+        # real time pacing
+
+        self._buf_cnt += 1
+
+        if self.realtime:
+            delay = self._start_time + float(self._buf_cnt * self._frames_per_buffer) / self.rate - time.time()
+            if delay > 0:
+                time.sleep(delay)
+
+        return buf
+
+    def release(self, buf):
+        # buffers are not recycled, for interface compatibility with PulseRecorder
+        pass
+
+    def frames(self):
+        return RecorderFrames(self)
+
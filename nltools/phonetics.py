@@ -17,6 +17,11 @@
 # limitations under the License.
 #
 
+import multiprocessing
+
+from collections import deque
+from itertools   import islice
+
 #
 # big phoneme table
 #
@@ -219,8 +224,39 @@ def _normalize (s, norm_table):
 
     return buf
 
+#
+# per-direction lookup indexes: map each phoneme in the source notation
+# to its counterpart in the target notation. Built lazily, once per
+# (f_idx, t_idx) pair. Like the linear table scan they replace, the first
+# table entry wins for duplicate source phonemes; entries which lack
+# either column (e.g. the noise phoneme has no espeak equivalent) are
+# skipped.
+#
+
+_phoneme_indexes = {}
+
+def _phoneme_index (f_idx, t_idx):
+
+    index = _phoneme_indexes.get((f_idx, t_idx))
+
+    if index is None:
+
+        index = {}
+
+        for pe in big_phoneme_table:
+            if len(pe) <= max(f_idx, t_idx):
+                continue
+            if not pe[f_idx] in index:
+                index[pe[f_idx]] = pe[t_idx]
+
+        _phoneme_indexes[(f_idx, t_idx)] = index
+
+    return index
+
 def _translate (graph, s, f_idx, t_idx, spaces=False):
 
+    index = _phoneme_index (f_idx, t_idx)
+
     buf = ""
     i = 0
     l = len(s)
@@ -234,23 +270,14 @@ def _translate (graph, s, f_idx, t_idx, spaces=False):
             if i + pl > l:
                 continue
 
-            substr = s[i : i+pl ]
-
-            #print u"i: %s, pl: %d, substr: '%s'" % (i, pl, substr)
-
-            for pe in big_phoneme_table:
-                p_f = pe[f_idx]
-                p_t = pe[t_idx]
+            p_t = index.get(s[i : i+pl ])
 
-                if substr == p_f:
-                    buf += p_t
-                    i += pl
-                    if i<l and s[i] != u'ː' and spaces:
-                        buf += ' '
-                    found = True
-                    break
-
-            if found:
+            if p_t is not None:
+                buf += p_t
+                i += pl
+                if i<l and s[i] != u'ː' and spaces:
+                    buf += ' '
+                found = True
                 break
 
         if not found:
@@ -473,12 +500,32 @@ XARPABET_normalization = {
     '\'': None,
     }
 
+xs2xa_index = {}
+for pe in xs2xa_table:
+    if not pe[0] in xs2xa_index:
+        xs2xa_index[pe[0]] = pe[1]
+
+#
+# conversion cache: lexicon exports convert the same transcriptions over and
+# over again. Only successful conversions are cached, the cache is simply
+# reset once it has grown to XARPABET_CACHE_SIZE entries.
+#
+
+XARPABET_CACHE_SIZE = 100000
+
+xarpabet_cache = {}
+
 def xsampa2xarpabet (graph, s):
-    s = _normalize (s,  XARPABET_normalization)
 
-    buf = ""
+    res = xarpabet_cache.get(s)
+    if res is not None:
+        return res
+
+    xs = _normalize (s,  XARPABET_normalization)
+
+    phonemes = []
     i = 0
-    l = len(s)
+    l = len(xs)
 
     while i < l:
 
@@ -489,33 +536,121 @@ def xsampa2xarpabet (graph, s):
             if i + pl > l:
                 continue
 
-            substr = s[i : i+pl ]
-
-            #print u"i: %s, pl: %d, substr: '%s'" % (i, pl, substr)
+            p_t = xs2xa_index.get(xs[i : i+pl ])
 
-            for pe in xs2xa_table:
-                p_f = pe[0]
-                p_t = pe[1]
-
-                if substr == p_f:
-                    if len(buf)>0:
-                        buf += ' '
-                    buf += p_t
-                    i += pl
-                    found = True
-                    break
-
-            if found:
+            if p_t is not None:
+                phonemes.append(p_t)
+                i += pl
+                found = True
                 break
 
         if not found:
 
-            p = s[i]
+            p = xs[i]
 
-            msg = u"xsampa2xarpabet: graph:'%s' - s:'%s' Phoneme not found: '%s' (%d) '%s'" % (graph, s, p, ord(p), s[i:])
+            msg = u"xsampa2xarpabet: graph:'%s' - s:'%s' Phoneme not found: '%s' (%d) '%s'" % (graph, xs, p, ord(p), xs[i:])
 
             raise Exception (msg.encode('UTF8'))
 
-    return buf
+    res = ' '.join(phonemes)
+
+    if len(xarpabet_cache) >= XARPABET_CACHE_SIZE:
+        xarpabet_cache.clear()
+    xarpabet_cache[s] = res
+
+    return res
+
+#
+# bulk lexicon conversion
+#
+# converts an iterable of (graph, transcription) pairs from one phonetic
+# alphabet to another, optionally in a pool of worker processes. Entries are
+# sent to the workers in chunks, at most 2 chunks per worker are in flight.
+# Conversion errors are collected per entry instead of aborting the whole run.
+#
+# returns (results, errors) where
+#   results: [ (graph, converted), ... ] for all successfully converted entries
+#   errors : [ (graph, transcription, message), ... ]
+# both in input order.
+#
+
+DEFAULT_CHUNKSIZE = 1000
+
+LEXICON_CONVERSIONS = {
+    ('ipa',    'xsampa')   : (ipa2xsampa, ),
+    ('ipa',    'mary')     : (ipa2mary, ),
+    ('ipa',    'espeak')   : (ipa2espeak, ),
+    ('ipa',    'xarpabet') : (ipa2xsampa, xsampa2xarpabet),
+    ('xsampa', 'ipa')      : (xsampa2ipa, ),
+    ('xsampa', 'xarpabet') : (xsampa2xarpabet, ),
+    ('mary',   'ipa')      : (mary2ipa, ),
+    ('espeak', 'ipa')      : (espeak2ipa, ),
+    }
+
+def _convert_chunk (args):
+
+    entries, src, dst = args
+
+    conversion = LEXICON_CONVERSIONS[(src, dst)]
+
+    results = []
+    errors  = []
+
+    for graph, transcription in entries:
+
+        try:
+            res = transcription
+            for f in conversion:
+                res = f(graph, res)
+            results.append((graph, res))
+
+        except Exception as e:
+            msg = e.args[0] if e.args else repr(e)
+            if isinstance(msg, bytes):
+                msg = msg.decode('UTF8')
+            errors.append((graph, transcription, msg))
+
+    return results, errors
+
+def convert_lexicon (entries, src='ipa', dst='xsampa', workers=None, chunksize=DEFAULT_CHUNKSIZE):
+
+    if not (src, dst) in LEXICON_CONVERSIONS:
+        raise Exception ('convert_lexicon: unsupported conversion %s -> %s' % (src, dst))
+
+    if not workers:
+        workers = multiprocessing.cpu_count()
+
+    if workers == 1:
+        return _convert_chunk((entries, src, dst))
+
+    results = []
+    errors  = []
+
+    it      = iter(entries)
+    pending = deque()
+    pool    = multiprocessing.Pool(workers)
+
+    try:
+        while True:
+
+            while len(pending) < 2 * workers:
+                chunk = list(islice(it, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.apply_async(_convert_chunk, ((chunk, src, dst),)))
+
+            if not pending:
+                break
+
+            r, e = pending.popleft().get()
+            results.extend(r)
+            errors.extend(e)
+
+        pool.close()
+
+    finally:
+        pool.terminate()
+        pool.join()
 
+    return results, errors
 
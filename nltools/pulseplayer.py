@@ -22,15 +22,15 @@
 
 from io import BytesIO
 import wave
-import copy
 import ctypes
-import wave
 import sys
 import logging
 
+from collections import deque
+
 from builtins import str as text
 
-from threading import Thread, Lock, Condition
+from threading import Thread, Lock, Condition, current_thread
 
 pa = ctypes.cdll.LoadLibrary('libpulse-simple.so.0')
  
@@ -38,6 +38,10 @@ PA_STREAM_PLAYBACK = 1
 PA_SAMPLE_S16LE = 3
 BUFFSIZE = 1024
 
+# playback buffer (and startup) latency. pa_simple's default (~2s) would
+# delay the start of streamed playback until that much audio is buffered
+TARGET_LATENCY = 0.25 # seconds
+
 # class struct_pa_sample_spec(ctypes.Structure):
 #     __slots__ = [
 #         'format',
@@ -60,6 +64,17 @@ class pa_sample_spec(ctypes.Structure):
                 ('channels', ctypes.c_uint8),
             ]
 
+class pa_buffer_attr(ctypes.Structure):
+    _fields_ = [
+                ('maxlength', ctypes.c_uint32),
+                ('tlength',   ctypes.c_uint32),
+                ('prebuf',    ctypes.c_uint32),
+                ('minreq',    ctypes.c_uint32),
+                ('fragsize',  ctypes.c_uint32),
+            ]
+
+PA_BUFFER_ATTR_DEFAULT = 0xffffffff
+
 pa_simple_new = pa.pa_simple_new
 pa_simple_new.restype  = ctypes.c_void_p # pointer(pa_simple)
 pa_simple_new.argtypes = [
@@ -94,115 +109,559 @@ pa_simple_free = pa.pa_simple_free
 pa_simple_free.restype = None
 pa_simple_free.argtypes = [ ctypes.c_void_p ]
 
+pa_simple_flush = pa.pa_simple_flush
+pa_simple_flush.restype = ctypes.c_int
+pa_simple_flush.argtypes = [
+                            ctypes.c_void_p,              # s
+                            ctypes.POINTER(ctypes.c_int), # error 
+                           ]
+
+pa_simple_get_latency = pa.pa_simple_get_latency
+pa_simple_get_latency.restype = ctypes.c_uint64
+pa_simple_get_latency.argtypes = [
+                                  ctypes.c_void_p,              # s
+                                  ctypes.POINTER(ctypes.c_int), # error 
+                                 ]
+
+#
+# PulsePlayer keeps one pa_simple stream per sample spec (rate, channels)
+# open, so consecutive prompts do not pay for connection setup. Streams are
+# created by play() / play_stream() on the calling thread, so setup errors
+# are raised to the caller. Pending sounds are kept in a queue and played
+# back to back by a playback thread without draining in between (gapless).
+# The stream is drained once the queue runs empty or the sample spec
+# changes.
+#
+# the playback thread runs while sounds are queued, played or drained and
+# ends after that (the next play() starts a new one). It is not a daemon
+# thread: like before, a script which exits right after an async play()
+# still plays the whole sound.
+#
+# play() interrupts the current sound and discards pending ones unless
+# enqueue=True is given.
+#
+# stop() and pause() (e.g. for barge-in) take effect within one buffer:
+# the playback thread checks for them before every BUFFSIZE write and
+# discards the audio buffered in the server via pa_simple_flush(). While
+# the playback thread is blocked in pa_simple_drain() or waiting for the
+# next chunk of a play_stream() iterator, the flush is issued from the
+# calling thread instead (libpulse-simple serializes its calls via the
+# mainloop lock) and stop() returns without waiting for the iterator.
+# pa_simple has no cork, so pause() remembers the audio flushed but not
+# played yet (up to MAX_REWIND seconds) and replays it on resume().
+#
+
+MAX_REWIND = 2.0 # seconds
+
+class _Sound(object):
+
+    def __init__(self, rate, channels, chunks, nframes=None):
+        self.rate       = rate
+        self.channels   = channels
+        self.frame_size = 2 * channels
+        self.chunks     = chunks
+        self.nframes    = nframes  # None: unknown (streams)
+        self.written    = 0        # frames written to the stream and not flushed
+        self.history    = b''      # last audio written, for rewinds
+        self.rewind     = b''      # audio to (re)write before the next chunk
+
 class PulsePlayer:
 
     def __init__(self, name):
-        self.name      = text(name)
-        self.playing   = False
-        self.terminate = False
-        self.thread    = None
-        self.lock      = Lock()
-        self.cond      = Condition(self.lock)
+        self.name       = text(name)
+        self.playing    = False    # sounds queued or being played
+        self.paused     = False
+        self.pause_cut  = False    # audio buffered at pause time has been flushed
+        self.terminate  = False    # interrupt the current sound
+        self.closing    = False
+        self.draining   = False    # playback thread blocked in pa_simple_drain()
+        self.pulling    = False    # playback thread waiting for the next chunk
+        self.thread     = None
+        self.lock       = Lock()
+        self.cond       = Condition(self.lock)
+        self.slock      = Lock()   # protects streams
+        self.queue      = deque()  # pending _Sounds
+        self.streams    = {}       # (rate, channels) -> pa_simple stream
+        self.cur_stream = None     # stream written to last, not drained yet
+        self.cur_sound  = None     # sound being played (or drained)
+        self.error      = ctypes.c_int(0)
+
+    def _stream(self, rate, channels):
+
+        self.slock.acquire()
+        try:
+            return self._stream_locked(rate, channels)
+        finally:
+            self.slock.release()
+
+    def _stream_locked(self, rate, channels):
+
+        s = self.streams.get((rate, channels))
+
+        if not s:
+
+            ss = pa_sample_spec()
+
+            ss.rate      = rate
+            ss.channels  = channels
+            ss.format    = PA_SAMPLE_S16LE
+
+            attr = pa_buffer_attr(PA_BUFFER_ATTR_DEFAULT,
+                                  int(TARGET_LATENCY * rate) * channels * 2,
+                                  PA_BUFFER_ATTR_DEFAULT,
+                                  PA_BUFFER_ATTR_DEFAULT,
+                                  PA_BUFFER_ATTR_DEFAULT)
+
+            s = pa_simple_new(
+                None,                    # Default server.
+                self.name.encode('utf8'),# Application's name.
+                PA_STREAM_PLAYBACK,      # Stream for playback.
+                None,                    # Default device.
+                b'playback',             # Stream's description.
+                ctypes.byref(ss),        # Sample format.
+                None,                    # Default channel map.
+                ctypes.byref(attr),      # Buffering attributes.
+                ctypes.byref(self.error) # Ignore error code.
+            )
+            if not s:
+                raise Exception('Could not create pulse audio stream, error: %d!' % self.error.value)
+
+            logging.debug ('pa_simple_new done, rate: %d, channels: %d, s: %s' % (rate, channels, repr(s)))
+
+            self.streams[(rate, channels)] = s
+
+        return s
+
+    def _free_stream(self, s):
+
+        self.slock.acquire()
+        for spec in list(self.streams):
+            if self.streams[spec] == s:
+                del self.streams[spec]
+        self.slock.release()
+
+        logging.debug ('pa.pa_simple_free %s...' % repr(s))
+        pa_simple_free(s)
+
+    def _drain(self, s):
+        if pa_simple_drain(s, ctypes.byref(self.error)):
+            raise Exception('Could not simple drain!')
+
+    def _flush(self, s):
+        error = ctypes.c_int(0)
+        if pa_simple_flush(s, ctypes.byref(error)):
+            logging.error('PulsePlayer: pa_simple_flush failed, error: %d' % error.value)
+
+    def _latency(self, s):
+
+        # seconds of audio written to s but not played yet
+
+        error   = ctypes.c_int(0)
+        latency = pa_simple_get_latency(s, ctypes.byref(error))
+        if error.value:
+            return 0.0
+        return latency / 1000000.0
+
+    def _write(self, s, sound, buf):
+
+        if pa_simple_write(s, buf, len(buf), ctypes.byref(self.error)):
+            raise Exception('Could not play sound, error: %d!' % self.error.value)
+
+        sound.written += len(buf) // sound.frame_size
+        sound.history  = (sound.history + buf)[-int(MAX_REWIND * sound.rate) * sound.frame_size:]
+
+    def _cut(self, s, sound):
+
+        # lock held, playback thread not writing: flush s, rewind sound to
+        # the position actually played
+
+        latency = self._latency(s)
+        self._flush(s)
+
+        n = min(int(latency * sound.rate) * sound.frame_size, len(sound.history))
+
+        tail          = sound.history[len(sound.history)-n:]
+        sound.history = sound.history[:len(sound.history)-n]
+        sound.written = max(0, sound.written - n // sound.frame_size)
+        sound.rewind  = tail + sound.rewind
+
+        self.pause_cut = True
+
+    def _pause(self, s, sound):
+
+        # playback thread, between writes: cut, then wait for resume()
+        # or stop()
+
+        self.lock.acquire()
+        try:
+            if not self.pause_cut:
+                self._cut(s, sound)
+
+            while self.paused and not self.terminate:
+                self.cond.wait()
+        finally:
+            self.lock.release()
+
+    def _next_chunk(self, sound):
+
+        # playback thread: next buffer to write, None at the end of sound.
+        # The iterator may block (streams), stop() and pause() flush from
+        # their calling thread meanwhile.
+
+        self.lock.acquire()
+        if sound.rewind:
+            buf, sound.rewind = sound.rewind, b''
+            self.lock.release()
+            return buf
+        self.pulling = True
+        self.cond.notifyAll()
+        self.lock.release()
+
+        buf = None
+
+        try:
+            buf = next(sound.chunks, None)
+        finally:
+            self.lock.acquire()
+            self.pulling = False
+
+            # a pause cut happened meanwhile: buf goes after the flushed audio
+            if buf is not None and (self.paused or sound.rewind):
+                sound.rewind += buf
+                buf = b''
+
+            self.lock.release()
+
+        return buf
 
     def _play_loop(self):
 
-        logging.debug("_play_loop starts, a_sound: %d bytes" % len(self.a_sound))
-
-        while not self.terminate:
-            #latency = pa.pa_simple_get_latency(s, error)
-            #if latency == -1:
-            #    raise Exception('Getting latency failed!')
-        
-            #print('{0} usec'.format(latency))
-        
-            # Reading frames and writing to the stream.
-            buf = self.wf.readframes(BUFFSIZE)
+        logging.debug("_play_loop starts")
+
+        while True:
+
+            self.lock.acquire()
+            try:
+                if self.closing:
+                    break
+
+                if not self.queue and self.cur_stream is None:
+                    # all played: end this thread, the next play() starts a new one
+                    self.playing = False
+                    if self.thread is current_thread():
+                        self.thread = None
+                    self.cond.notifyAll()
+                    break
+
+                sound = None
+                if self.queue:
+                    sound = self.queue.popleft()
+                    self.terminate = False
+                else:
+                    self.draining = True
+
+                s = self.cur_stream
+
+            finally:
+                self.lock.release()
+
+            try:
+                if not sound:
+
+                    # queue ran empty: wait for the audio written so far to be
+                    # played. stop() / pause() may cut this short.
+
+                    try:
+                        self._drain(s)
+                    finally:
+                        self.lock.acquire()
+                        self.draining = False
+                        if not self.queue:
+                            self.cur_stream = None
+                            self.cur_sound  = None
+                        self.lock.release()
+
+                    continue
+
+                s = self._stream(sound.rate, sound.channels)
+                if self.cur_stream and self.cur_stream != s:
+                    self._drain(self.cur_stream)
+
+                self.lock.acquire()
+                self.cur_stream = s
+                self.cur_sound  = sound
+                self.lock.release()
+
+                while True:
+
+                    if self.paused:
+                        self._pause(s, sound)
+
+                    if self.terminate:
+                        break
+
+                    buf = self._next_chunk(sound)
+                    if buf is None or self.terminate:
+                        break
+
+                    if buf:
+                        self._write(s, sound, buf)
+
+                if self.terminate:
+                    self._flush(s)
+                    self.lock.acquire()
+                    self.cur_stream = None
+                    self.cur_sound  = None
+                    self.lock.release()
+
+            except Exception as e:
+                logging.error('PulsePlayer: %s' % e)
+                self.lock.acquire()
+                if self.cur_stream:
+                    self._free_stream(self.cur_stream)
+                self.cur_stream = None
+                self.cur_sound  = None
+                self.lock.release()
+
+        logging.debug("_play_loop ends")
+
+    def _wav_chunks(self, wf):
+
+        while True:
+            buf = wf.readframes(BUFFSIZE)
             if not buf:
                 break
+            yield buf
 
-            # logging.debug("_play_loop len: %d self.s: %s" % (len(buf), repr(self.s)))
-        
-            if pa_simple_write(self.s, buf, len(buf), ctypes.byref(self.error)):
-                raise Exception('Could not play file, error: %d!' % self.error.value)
-        
-        self.wf.close()
+        wf.close()
 
-        if pa_simple_drain(self.s, ctypes.byref(self.error)):
-            raise Exception('Could not simple drain!')
+    def _pcm_chunks(self, chunks, frame_size):
+
+        # pass bytes through as they are, split off incomplete frames
+
+        rest = b''
+
+        for buf in chunks:
 
-        # Freeing resources and closing connection.
-        logging.debug ('pa.pa_simple_free %s...' % repr(self.s))
-        pa_simple_free(self.s)
+            if not isinstance(buf, bytes):
+                buf = buf.tobytes() if hasattr(buf, 'tobytes') else bytes(buf)
+
+            if rest:
+                buf  = rest + buf
+                rest = b''
+
+            l = len(buf) - len(buf) % frame_size
+            if l < len(buf):
+                buf, rest = buf[:l], buf[l:]
+
+            if buf:
+                yield buf
+
+    def _enqueue(self, sound, enqueue):
 
         self.lock.acquire()
         try:
-            self.playing = False
+            if not enqueue:
+                # interrupt current and discard pending sounds
+                self.terminate = True
+                self.queue.clear()
+
+            self.queue.append(sound)
+            self.playing = True
+
+            if not self.thread:
+                self.closing = False
+                self.thread  = Thread(target=self._play_loop)
+                self.thread.start()
+
             self.cond.notifyAll()
+
         finally:
             self.lock.release()
 
-    def play(self, a_sound, async=True):
+    def wait(self):
 
-        logging.debug("play starts, async: %s" % repr(async))
+        # wait for all queued sounds to finish playing
 
         self.lock.acquire()
         try:
-            self.terminate = True
             while self.playing:
                 self.cond.wait()
+        finally:
+            self.lock.release()
 
-            if self.thread:
-                self.thread.join()
-                self.thread = None
+    def play(self, a_sound, async=True, enqueue=False):
 
-            self.terminate = False
-            self.playing   = True
-            self.a_sound   = copy.copy(a_sound)
+        logging.debug("play starts, async: %s, enqueue: %s" % (repr(async), repr(enqueue)))
 
-            self.wf = wave.open(BytesIO(self.a_sound), 'rb')
+        wf = wave.open(BytesIO(a_sound), 'rb')
 
-            self.ss = pa_sample_spec()
+        # raises if the stream cannot be set up
+        self._stream(wf.getframerate(), wf.getnchannels())
 
-            self.ss.rate      = self.wf.getframerate()
-            self.ss.channels  = self.wf.getnchannels()
-            self.ss.format    = PA_SAMPLE_S16LE
+        self._enqueue(_Sound(wf.getframerate(), wf.getnchannels(), self._wav_chunks(wf), wf.getnframes()), enqueue)
 
-            # logging.debug("frame rate: %d, channels: %d" % (self.ss.rate, self.ss.channels))
+        if not async:
+            # wait for player to finish
+            self.wait()
 
-            self.error = ctypes.c_int(0)
-    
-            self.s = pa_simple_new(
-                None,                    # Default server.
-                self.name.encode('utf8'),# Application's name.
-                PA_STREAM_PLAYBACK,      # Stream for playback.
-                None,                    # Default device.
-                b'playback',             # Stream's description.
-                ctypes.byref(self.ss),   # Sample format.
-                None,                    # Default channel map.
-                None,                    # Default buffering attributes.
-                ctypes.byref(self.error) # Ignore error code.
-            )
-            if not self.s:
-                raise Exception('Could not create pulse audio stream: {0}!'.format(
-                    pa.strerror(ctypes.byref(self.error))))
+    def play_stream(self, chunks, rate, channels=1, async=True, enqueue=False):
+
+        # play 16 bit little endian PCM from an iterator of chunks (bytes,
+        # bytearrays, memoryviews or numpy int16 arrays) as they are
+        # produced, e.g. by a streaming TTS engine. Chunks are consumed by
+        # the playback thread.
 
-            logging.debug ('pa_simple_new done, self.s: %s' % repr(self.s))
+        logging.debug("play_stream starts, rate: %d, channels: %d, async: %s, enqueue: %s" % (rate, channels, repr(async), repr(enqueue)))
+
+        self._stream(rate, channels)
+
+        self._enqueue(_Sound(rate, channels, self._pcm_chunks(iter(chunks), 2 * channels)), enqueue)
+
+        if not async:
+            self.wait()
+
+    def stop(self):
+
+        # barge-in: cut off the current sound, discard pending ones
+
+        self.lock.acquire()
+        try:
+            self.terminate = True
+            self.paused    = False
+            self.queue.clear()
+
+            if (self.draining or self.pulling) and self.cur_stream:
+                self._flush(self.cur_stream)
+
+            self.cond.notifyAll()
+
+            # wait for the current write to finish, but not for the next
+            # chunk of a stream
+
+            while self.playing and not self.pulling:
+                self.cond.wait()
+
+            self.playing   = False
+            self.cur_sound = None
+            self.cond.notifyAll()
 
         finally:
             self.lock.release()
 
-        self.thread = Thread(target=self._play_loop)
-        self.thread.start()
+    def pause(self):
 
-        if not async:
-            # wait for player to finish
-            self.lock.acquire()
-            try:
-                while self.playing:
-                    self.cond.wait()
+        self.lock.acquire()
+        try:
+            if self.paused or not self.playing:
+                return
 
-                self.thread.join()
-                self.thread = None
-            finally:
-                self.lock.release()
+            self.paused    = True
+            self.pause_cut = False
+
+            if not self.cur_stream or not self.cur_sound:
+                return
+
+            # playback thread blocked in pa_simple_drain(): cut from here and
+            # requeue the flushed audio for resume()
+
+            if self.draining:
+                sound = self.cur_sound
+                self._cut(self.cur_stream, sound)
+                sound.chunks = iter([])
+                self.queue.appendleft(sound)
+
+            # playback thread waiting for the next chunk: cut from here,
+            # the thread holds back that chunk until resume()
+
+            elif self.pulling:
+                self._cut(self.cur_stream, self.cur_sound)
+
+        finally:
+            self.lock.release()
+
+    def resume(self):
+
+        self.lock.acquire()
+        self.paused = False
+        self.cond.notifyAll()
+        self.lock.release()
+
+    def position(self):
+
+        # playback position within the current sound in seconds, None if idle
+
+        self.lock.acquire()
+        try:
+            s, sound = self.cur_stream, self.cur_sound
+            if not sound:
+                return None
+            written = float(sound.written) / sound.rate
+            if self.paused and self.pause_cut:
+                return written
+        finally:
+            self.lock.release()
+
+        return max(0.0, written - self._latency(s))
+
+    def remaining(self):
+
+        # playback time left for the current and all queued sounds in
+        # seconds, None if idle or unknown (streams)
+
+        self.lock.acquire()
+        try:
+            cur    = self.cur_sound
+            sounds = [ sound for sound in self.queue if sound is not cur ]
+        finally:
+            self.lock.release()
+
+        if cur:
+            sounds.insert(0, cur)
+
+        if not sounds:
+            return None
+
+        remaining = 0.0
+
+        for sound in sounds:
+            if sound.nframes is None:
+                return None
+            remaining += float(sound.nframes) / sound.rate
+
+        if cur:
+            remaining -= self.position() or 0.0
+
+        return max(0.0, remaining)
+
+    def close(self):
+
+        # stop playback, terminate the playback thread and free all streams
+
+        self.lock.acquire()
+        try:
+            self.closing   = True
+            self.terminate = True
+            self.paused    = False
+            self.queue.clear()
+            if (self.draining or self.pulling) and self.cur_stream:
+                self._flush(self.cur_stream)
+            self.cond.notifyAll()
+            thread = self.thread
+            self.thread = None
+        finally:
+            self.lock.release()
+
+        if thread:
+            thread.join()
+
+        for s in list(self.streams.values()):
+            self._free_stream(s)
+
+        self.lock.acquire()
+        self.cur_stream = None
+        self.cur_sound  = None
+        self.playing    = False
+        self.cond.notifyAll()
+        self.lock.release()
 
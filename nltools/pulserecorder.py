@@ -27,6 +27,8 @@ import logging
 import time
     
 import numpy as np
+
+from collections import deque
 from builtins import str as text, range
 from nltools.vad import BUFFER_DURATION
 
@@ -290,6 +292,64 @@ DEFAULT_NAME              = b'Python PulseRecorder'
 DEFAULT_FRAMES_PER_BUFFER = int(DEFAULT_RATE * BUFFER_DURATION / 1000)
 DEFAULT_MIX_MODE          = MIX_MODE_BOTH
 
+#
+# buffer queue overflow policies, used when the consumer falls behind by
+# more than max_buffers buffers
+#
+
+OVERFLOW_DROP_OLDEST      = 0
+OVERFLOW_DROP_NEWEST      = 1
+OVERFLOW_BLOCK            = 2
+
+DEFAULT_MAX_BUFFERS       = 1000 # 30 seconds at 30ms per buffer
+DEFAULT_OVERFLOW          = OVERFLOW_DROP_OLDEST
+
+#
+# RecorderFrames: iterator over the buffers of a PulseRecorder, both
+#
+#     for samples in recorder.frames():          # blocking
+#
+# and (python 3.5+, from within an asyncio event loop)
+#
+#     async for samples in recorder.frames():
+#
+# iteration ends once recording has been stopped and all buffers recorded
+# so far have been consumed. The asyncio variant does not block a thread:
+# the PulseAudio mainloop thread hands buffers over to waiting futures via
+# loop.call_soon_threadsafe(). Implemented without async/await syntax so
+# this module still loads on python 2.
+#
+
+class RecorderFrames(object):
+
+    def __init__(self, recorder):
+        self.recorder = recorder
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        buf = self.recorder._get_samples(stop=True)
+        if buf is None:
+            raise StopIteration
+        return buf
+
+    next = __next__
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        fut  = loop.create_future()
+
+        self.recorder._get_samples_async(loop, fut)
+
+        return fut
+
 class PulseRecorder(object):
 
     def __init__(self, volume=DEFAULT_VOLUME, rate=DEFAULT_RATE, source_name=None):
@@ -314,23 +374,29 @@ class PulseRecorder(object):
         self._lock = threading.Lock()
         self._cond = threading.Condition(self._lock) 
 
-    def start_recording(self, frames_per_buffer = DEFAULT_FRAMES_PER_BUFFER, mix_mode = DEFAULT_MIX_MODE):
+    def start_recording(self, frames_per_buffer = DEFAULT_FRAMES_PER_BUFFER, mix_mode = DEFAULT_MIX_MODE,
+                        max_buffers = DEFAULT_MAX_BUFFERS, overflow = DEFAULT_OVERFLOW):
 
         logging.debug("start_recording...")
 
         self._frames_per_buffer = frames_per_buffer
         self._mix_mode          = mix_mode
         self._record_stereo     = mix_mode != MIX_MODE_BOTH
-        self._buffers           = []
+        self._max_buffers       = max_buffers
+        self._overflow          = overflow
+        self._queue             = deque()  # full buffers, oldest first
+        self._pool              = []       # recycled buffers
+        self._cur_buf           = np.empty(self._frames_per_buffer, dtype=np.int16)
         self._cur_buf_cnt       = 0
+        self._recording         = True
+        self._waiters           = deque()  # (loop, future) of pending async frames() consumers
+        self.overruns           = 0
         self.source_idx         = -1
         self.source_score       = 0
         self.source_log         = False
         self.source_name        = ''
         self.source_description = ''
 
-        self._buffers.append(np.empty(self._frames_per_buffer, dtype=np.int16))
-
         self._mainloop = pa_threaded_mainloop_new()
         _mainloop_api  = pa_threaded_mainloop_get_api(self._mainloop)
         self._context  = pa_context_new(_mainloop_api, DEFAULT_NAME)
@@ -353,6 +419,16 @@ class PulseRecorder(object):
 
         logging.debug("stop_recording...")
 
+        # wake up a stream_read_cb blocked on a full queue
+
+        self._lock.acquire()
+        self._recording = False
+        self._cond.notifyAll()
+        while self._waiters:
+            loop, fut = self._waiters.popleft()
+            self._call_soon(loop, self._resolve, fut, None)
+        self._lock.release()
+
         pa_threaded_mainloop_lock(self._mainloop)
         pa_context_disconnect(self._context)
         pa_context_unref(self._context)
@@ -470,58 +546,176 @@ class PulseRecorder(object):
             self.source_description = source_info.description
 
 
-    def stream_read_cb(self, stream, length, index_incr):
-        data = ctypes.c_void_p()
-        pa_stream_peek(stream, data, ctypes.c_ulong(length))
-        data = ctypes.cast(data, ctypes.POINTER(ctypes.c_ubyte))
+    def _enqueue(self):
 
-        self._lock.acquire()
+        # current buffer is full, caller holds self._lock
 
-        bytes_per_sample = 4 if self._record_stereo else 2
-        num_samples = int(length / bytes_per_sample)
+        if self._max_buffers and len(self._queue) >= self._max_buffers:
 
-        for i in range(num_samples):
+            self.overruns += 1
+            logging.debug("PulseRecorder: buffer overrun #%d" % self.overruns)
 
-            if self._mix_mode == MIX_MODE_BOTH:
-                off_low  = 0
-                off_high = 1
-            elif self._mix_mode == MIX_MODE_LEFT:
-                off_low  = 0
-                off_high = 1
-            elif self._mix_mode == MIX_MODE_RIGHT:
-                off_low  = 2
-                off_high = 3
+            if self._overflow == OVERFLOW_BLOCK:
+                while len(self._queue) >= self._max_buffers and self._recording:
+                    self._cond.wait()
+
+            if len(self._queue) >= self._max_buffers:
+
+                if self._overflow == OVERFLOW_DROP_NEWEST:
+                    self._cur_buf_cnt = 0
+                    return
+
+                self._pool.append(self._queue.popleft())
+
+        self._queue.append(self._cur_buf)
+
+        self._cur_buf     = self._pool.pop() if self._pool else np.empty(self._frames_per_buffer, dtype=np.int16)
+        self._cur_buf_cnt = 0
+
+        # async frames() consumers waiting?
+        while self._waiters and self._queue:
+            loop, fut = self._waiters.popleft()
+            buf = self._queue.popleft()
+            if not self._call_soon(loop, self._resolve, fut, buf):
+                self._queue.appendleft(buf)
+
+        self._cond.notifyAll()
 
-            sample = data[i*bytes_per_sample +off_low ] + 256 * data[i*bytes_per_sample+off_high]
+    def _append_samples(self, samples):
 
-            self._buffers[len(self._buffers)-1][self._cur_buf_cnt] = sample
-            self._cur_buf_cnt += 1 
+        # copy samples into the buffers in bulk, caller holds self._lock
+
+        pos = 0
+        num_samples = len(samples)
+
+        while pos < num_samples:
+
+            n = min(self._frames_per_buffer - self._cur_buf_cnt, num_samples - pos)
+
+            self._cur_buf[self._cur_buf_cnt:self._cur_buf_cnt+n] = samples[pos:pos+n]
+            self._cur_buf_cnt += n
+            pos               += n
 
             # buffer full?
             if self._cur_buf_cnt >= self._frames_per_buffer:
+                self._enqueue()
+
+    def stream_read_cb(self, stream, length, index_incr):
 
-                self._buffers.append(np.empty(self._frames_per_buffer, dtype=np.int16))
-                self._cur_buf_cnt = 0
+        data   = ctypes.c_void_p()
+        nbytes = ctypes.c_size_t()
+        pa_stream_peek(stream, data, nbytes)
 
-                self._cond.notifyAll()
+        # no data at all: nothing to drop
+        if not nbytes.value:
+            return
 
+        # NULL data: hole in the stream, just drop it
+        if data.value:
 
-        self._lock.release()
+            bytes_per_sample = 4 if self._record_stereo else 2
+            num_bytes        = nbytes.value - nbytes.value % bytes_per_sample
+
+            # zero-copy view of the fragment, only valid until pa_stream_drop()
+            samples = np.frombuffer((ctypes.c_char * num_bytes).from_address(data.value), dtype='<i2')
+
+            # de-interleave stereo
+            if self._mix_mode == MIX_MODE_LEFT:
+                samples = samples[0::2]
+            elif self._mix_mode == MIX_MODE_RIGHT:
+                samples = samples[1::2]
+
+            self._lock.acquire()
+            try:
+                self._append_samples(samples)
+            finally:
+                self._lock.release()
 
         pa_stream_drop(stream)
 
 
-    def get_samples(self):
+    def _get_samples(self, stop=False):
+
+        # stop: return None instead of waiting once recording has stopped
 
         self._lock.acquire()
 
-        buf = None
-        while len(self._buffers) < 2:
-            self._cond.wait()
+        try:
+            while not self._queue:
+                if stop and not self._recording:
+                    return None
+                self._cond.wait()
 
-        buf = self._buffers.pop(0)
+            buf = self._queue.popleft()
 
-        self._lock.release()
+            # wake up a stream_read_cb blocked on a full queue
+            if self._overflow == OVERFLOW_BLOCK:
+                self._cond.notifyAll()
+
+        finally:
+            self._lock.release()
 
         return buf
 
+    def get_samples(self):
+        return self._get_samples()
+
+    def frames(self):
+        return RecorderFrames(self)
+
+    def _call_soon(self, loop, cb, *args):
+        try:
+            loop.call_soon_threadsafe(cb, *args)
+            return True
+        except RuntimeError:
+            # event loop closed
+            return False
+
+    def _resolve(self, fut, buf):
+
+        # runs in the event loop thread
+
+        if fut.cancelled():
+            if buf is not None:
+                self._lock.acquire()
+                self._queue.appendleft(buf)
+                self._lock.release()
+            return
+
+        if buf is None:
+            fut.set_exception(StopAsyncIteration())
+        else:
+            fut.set_result(buf)
+
+    def _get_samples_async(self, loop, fut):
+
+        # runs in the event loop thread
+
+        self._lock.acquire()
+
+        try:
+            if self._queue:
+                buf = self._queue.popleft()
+                if self._overflow == OVERFLOW_BLOCK:
+                    self._cond.notifyAll()
+                fut.set_result(buf)
+            elif not self._recording:
+                fut.set_exception(StopAsyncIteration())
+            else:
+                self._waiters.append((loop, fut))
+
+        finally:
+            self._lock.release()
+
+    def release(self, buf):
+
+        # optional: hand a buffer returned by get_samples() back for reuse
+        # once the caller is done with it
+
+        self._lock.acquire()
+
+        if len(buf) == self._frames_per_buffer and (not self._max_buffers or len(self._pool) < self._max_buffers):
+            self._pool.append(buf)
+
+        self._lock.release()
+
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# Copyright 2018 Guenter Bartsch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# nltools-tokenize: streaming corpus tokenizer
+#
+# reads a (plain, gzip or bz2 compressed) text corpus line by line,
+# tokenizes each line and writes the space-joined tokens, one line per
+# input line, to stdout or a file.
+#
+# pipeline: a reader thread decompresses and decodes lines into a bounded
+# queue, tokenize_many() tokenizes them in a pool of worker processes and
+# the main thread writes results in input order. Memory usage is bounded
+# by the queue size and the number of chunks in flight, not by corpus size.
+#
+
+import sys
+import gzip
+import bz2
+import logging
+
+from optparse          import OptionParser
+from threading         import Thread
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from nltools.tokenizer import tokenize_many, DEFAULT_CHUNKSIZE
+
+DEFAULT_LANG      = 'de'
+DEFAULT_ENCODING  = 'utf8'
+READER_QUEUE_SIZE = 10000
+
+def open_corpus (fn):
+
+    if fn == '-':
+        return getattr(sys.stdin, 'buffer', sys.stdin)
+    if fn.endswith('.gz'):
+        return gzip.open(fn, 'rb')
+    if fn.endswith('.bz2'):
+        return bz2.BZ2File(fn, 'rb')
+    return open(fn, 'rb')
+
+class CorpusReader(Thread):
+
+    def __init__(self, fns, encoding=DEFAULT_ENCODING, maxsize=READER_QUEUE_SIZE):
+        Thread.__init__(self)
+        self.fns      = fns
+        self.encoding = encoding
+        self.queue    = queue.Queue(maxsize)
+        self.error    = None
+        self.daemon   = True
+
+    def run(self):
+
+        try:
+            for fn in self.fns:
+
+                logging.debug('reading %s ...' % fn)
+
+                f = open_corpus(fn)
+                try:
+                    for line in f:
+                        self.queue.put(line.decode(self.encoding, 'replace').rstrip(u'\r\n'))
+                finally:
+                    if fn != '-':
+                        f.close()
+
+        except Exception as e:
+            logging.error('CorpusReader: %s' % e)
+            self.error = e
+
+        finally:
+            self.queue.put(None)
+
+    def __iter__(self):
+
+        while True:
+            line = self.queue.get()
+            if line is None:
+                break
+            yield line
+
+        if self.error:
+            raise self.error
+
+def tokenize_corpus (fns, outf, lang=DEFAULT_LANG, keep_punctuation=False, workers=None, chunksize=DEFAULT_CHUNKSIZE,
+                     encoding=DEFAULT_ENCODING):
+
+    reader = CorpusReader(fns, encoding=encoding)
+    reader.start()
+
+    cnt = 0
+    for tokens in tokenize_many(reader, lang=lang, keep_punctuation=keep_punctuation,
+                                workers=workers, chunksize=chunksize):
+
+        outf.write((u' '.join(tokens) + u'\n').encode(encoding))
+
+        cnt += 1
+        if cnt % 100000 == 0:
+            logging.info('%9d lines tokenized.' % cnt)
+
+    reader.join()
+
+    return cnt
+
+def main (argv=None):
+
+    parser = OptionParser("usage: %prog [options] [corpus.txt|corpus.txt.gz|corpus.txt.bz2 ...]")
+
+    parser.add_option ("-l", "--lang", dest="lang", type="str", default=DEFAULT_LANG,
+                       help="language (default: %s)" % DEFAULT_LANG)
+
+    parser.add_option ("-o", "--output", dest="output", type="str",
+                       help="output file (default: stdout)")
+
+    parser.add_option ("-p", "--keep-punctuation", action="store_true", dest="keep_punctuation",
+                       help="keep punctuation tokens")
+
+    parser.add_option ("-w", "--workers", dest="workers", type="int", default=0,
+                       help="number of worker processes (default: number of cpus)")
+
+    parser.add_option ("-c", "--chunksize", dest="chunksize", type="int", default=DEFAULT_CHUNKSIZE,
+                       help="number of lines per worker chunk (default: %d)" % DEFAULT_CHUNKSIZE)
+
+    parser.add_option ("-e", "--encoding", dest="encoding", type="str", default=DEFAULT_ENCODING,
+                       help="input and output encoding (default: %s)" % DEFAULT_ENCODING)
+
+    parser.add_option ("-v", "--verbose", action="store_true", dest="verbose",
+                       help="enable verbose logging")
+
+    (options, args) = parser.parse_args(argv)
+
+    if options.verbose:
+        logging.basicConfig(level=logging.DEBUG)
+    else:
+        logging.basicConfig(level=logging.INFO)
+
+    if not args:
+        args = ['-']
+
+    if options.output:
+        outf = open(options.output, 'wb')
+    else:
+        outf = getattr(sys.stdout, 'buffer', sys.stdout)
+
+    try:
+        cnt = tokenize_corpus(args, outf, lang=options.lang, keep_punctuation=options.keep_punctuation,
+                              workers=options.workers, chunksize=options.chunksize, encoding=options.encoding)
+    finally:
+        if options.output:
+            outf.close()
+        else:
+            outf.flush()
+
+    logging.info('%d lines tokenized.' % cnt)
+
+    return 0
+
+if __name__ == "__main__":
+
+    sys.exit(main())
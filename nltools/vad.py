@@ -21,12 +21,19 @@
 # Voice Activity Detection (VAD) state machine
 #
 
+import time
 import logging
 import webrtcvad
 
+import numpy as np
+
+from collections     import namedtuple
+
+from nltools.wavfile import mmap_wav
+
 SAMPLE_RATE           = 16000
 BUFFER_DURATION       = 30 # ms
-RING_BUF_ENTRIES      =  5 * 60 * 1000 / BUFFER_DURATION # 5 minutes max
+RING_BUF_ENTRIES      =  5 * 60 * 1000 // BUFFER_DURATION # 5 minutes max
 
 MIN_UTT_LENGTH        = 0.4 # seconds
 MAX_UTT_LENGTH        = 12  # seconds
@@ -47,6 +54,29 @@ FRAME_STAT_CNT        =   300
 LOW_VOLUME_THRESH     =   100
 HIGH_VOLUME_THRESH    = 25000
 
+IDLE_TIMEOUT          =    60 # seconds
+EVICT_INTERVAL        =     1 # seconds
+
+#
+# audio is kept in a preallocated int16 ring buffer of max_utt_length + 1
+# frames (capped at RING_BUF_ENTRIES frames):
+#
+# - once the buffer is full, frames already returned are dropped. The
+#   remaining frames are moved to the front so returned audio is always a
+#   contiguous numpy view into the buffer. Callers have to consume (or
+#   copy) it before the next call to process_audio().
+# - the pre speech phase is not limited by max_utt_length (speech
+#   alternating with short gaps), all of it is returned once speech is
+#   detected. If it does not fit, the buffer grows up to RING_BUF_ENTRIES
+#   frames, beyond that new frames are not stored. The buffer shrinks
+#   back at the start of the next utterance.
+# - in the ignore states frames are only counted, never stored: ignored
+#   audio is never returned.
+#
+# so memory per VAD instance stays at max_utt_length, no matter how long a
+# stream stays noisy.
+#
+
 class VAD(object):
 
     def __init__(self, aggressiveness=2, sample_rate=SAMPLE_RATE,
@@ -60,132 +90,381 @@ class VAD(object):
         self.vad = webrtcvad.Vad()
         self.vad.set_mode(aggressiveness)
 
-        self.state          = STATE_IDLE
-        self.buf            = []
-        self.buf_sent       = 0
+        self.min_buf_entries = int(min_utt_length * 1000) // BUFFER_DURATION 
+        self.max_buf_entries = int(max_utt_length * 1000) // BUFFER_DURATION
+        self.max_gap         = int(max_utt_gap    * 1000) // BUFFER_DURATION
+
+        frame_len            = sample_rate * BUFFER_DURATION // 1000
 
-        self.min_buf_entries = int(min_utt_length * 1000) / BUFFER_DURATION 
-        self.max_buf_entries = int(max_utt_length * 1000) / BUFFER_DURATION
-        self.max_gap         = int(max_utt_gap    * 1000) / BUFFER_DURATION
+        self.buf_size        = min(RING_BUF_ENTRIES, self.max_buf_entries + 1) * frame_len
+        self.buf_max_size    = RING_BUF_ENTRIES * frame_len
+
+        self.state          = STATE_IDLE
+        self.buf            = np.empty(self.buf_size, dtype=np.int16)
+        self.buf_frames     = 0    # number of frames in current utterance
+        self.buf_len        = 0    # number of samples stored
+        self.buf_sent       = 0    # number of stored samples returned so far
 
         self.frame_cnt       = 0
         self.avg_vol_sum     = 0.0
         self.avg_vol_cnt     = 0
 
-    def _return_audio (self, finalize):
+    def _start_utterance (self):
+
+        self.buf_frames = 0
+        self.buf_len    = 0
+        self.buf_sent   = 0
+
+        if len(self.buf) > self.buf_size:
+            self.buf = np.empty(self.buf_size, dtype=np.int16)
+
+    def _append (self, frame):
+
+        self.buf_frames += 1
+
+        n   = len(frame)
+        cap = len(self.buf)
+
+        if self.buf_len + n > cap:
+
+            keep = self.buf_len - self.buf_sent
+
+            if keep + n > cap:
+
+                # long pre speech phase: grow, drop the frame once at RING_BUF_ENTRIES
+
+                if keep + n > self.buf_max_size:
+                    return
+
+                buf = np.empty(min(max(2 * cap, keep + n), self.buf_max_size), dtype=np.int16)
+
+            else:
+                buf = self.buf
 
-        res = []
+            # drop frames already sent
 
-        buf_max = len(self.buf)-1
+            if keep > 0:
+                buf[:keep] = self.buf[self.buf_sent:self.buf_len]
 
-        while self.buf_sent <= buf_max:
-            res.extend(self.buf[self.buf_sent].tolist())
-            self.buf_sent += 1
+            self.buf      = buf
+            self.buf_len  = keep
+            self.buf_sent = 0
+
+        self.buf[self.buf_len:self.buf_len+n] = frame
+        self.buf_len += n
+
+    def _return_audio (self, finalize):
+
+        res = self.buf[self.buf_sent:self.buf_len]
+        self.buf_sent = self.buf_len
 
         return res, finalize
 
-    def process_audio (self, audio):
+    def flush (self):
+
+        # end of stream: finalize an utterance in progress, drop anything else
+
+        state = self.state
+        self.state = STATE_IDLE
+
+        if state == STATE_SPEECH or state == STATE_GAP:
+            return self._return_audio(True)
+
+        return None, False
+
+    def segment_audio (self, samples):
+
+        # offline segmentation: run the state machine over samples in
+        # BUFFER_DURATION frames as fast as possible, yields (start, end)
+        # sample offsets of the utterances detected. A trailing partial
+        # frame is ignored.
+
+        frame_len = self.sample_rate * BUFFER_DURATION // 1000
 
-        cur_frame = audio
+        start = None
+        end   = 0
+
+        for pos in range(0, len(samples) - frame_len + 1, frame_len):
+
+            end = pos + frame_len
+
+            audio, finalize = self.process_audio(samples[pos:end])
+            if audio is None:
+                continue
+
+            if start is None:
+                start = end - len(audio)
+
+            if finalize:
+                yield start, end
+                start = None
+
+        # input may end right at speech detection, before any audio was returned
+
+        audio, finalize = self.flush()
+        if audio is not None:
+            if start is None:
+                start = end - len(audio)
+            yield start, end
+
+    def segment_file (self, wavfn):
+
+        samples, sample_rate = mmap_wav(wavfn)
+
+        if sample_rate != self.sample_rate:
+            raise Exception ('%s: sample rate %d does not match VAD sample rate %d' % (wavfn, sample_rate, self.sample_rate))
+
+        return self.segment_audio(samples)
+
+    def _volume_stats (self, vol_sum, vol_cnt):
 
         # give feedback if volume too low / too high
-        if self.frame_cnt <= FRAME_STAT_CNT:
 
-            for sample in audio:
-                self.avg_vol_sum += abs(sample)
-                self.avg_vol_cnt += 1
+        self.avg_vol_sum += vol_sum
+        self.avg_vol_cnt += vol_cnt
 
-            self.frame_cnt += 1
-            if self.frame_cnt == FRAME_STAT_CNT:
+        self.frame_cnt += 1
+        if self.frame_cnt == FRAME_STAT_CNT:
 
-                # import pdb; pdb.set_trace()
+            self.avg_vol_sum /= float(self.avg_vol_cnt)
 
-                self.avg_vol_sum /= float(self.avg_vol_cnt)
+            if self.avg_vol_sum < LOW_VOLUME_THRESH:
+                logging.error ('VAD: audio volume too low or wrong source?')
+            elif self.avg_vol_sum > HIGH_VOLUME_THRESH:
+                logging.error ('VAD: audio volume too high or wrong source?')
 
-                if self.avg_vol_sum < LOW_VOLUME_THRESH:
-                    logging.error ('VAD: audio volume too low or wrong source?')
-                elif self.avg_vol_sum > HIGH_VOLUME_THRESH:
-                    logging.error ('VAD: audio volume too high or wrong source?')
+    def process_audio (self, audio):
+
+        audio = np.asarray(audio, dtype=np.int16)
+
+        if self.frame_cnt <= FRAME_STAT_CNT:
+            self._volume_stats(float(np.abs(audio.astype(np.int32)).sum()), len(audio))
 
-        vad_res = self.vad.is_speech(audio.tobytes(), self.sample_rate)
+        return self._process_frame(audio, self.vad.is_speech(audio.tobytes(), self.sample_rate))
+
+    def _process_frame (self, audio, vad_res):
 
         if self.state == STATE_IDLE:
             if vad_res:
                 self.state       = STATE_PRE_SPEECH
-                self.buf         = [ cur_frame ]
-                self.buf_sent    = 0
+                self._start_utterance()
+                self._append(audio)
 
         elif self.state == STATE_PRE_SPEECH:
-            self.buf.append(cur_frame)
+            self._append(audio)
             if vad_res: 
-                if len (self.buf) > self.min_buf_entries:
-                    logging.debug ("*** SPEECH DETECTED at frame %3d ***" % len(self.buf))
+                if self.buf_frames > self.min_buf_entries:
+                    logging.debug ("*** SPEECH DETECTED at frame %3d ***" % self.buf_frames)
                     self.state = STATE_SPEECH
 
             else:
                 self.state     = STATE_PRE_GAP
-                self.gap_start = len(self.buf)
+                self.gap_start = self.buf_frames
 
         elif self.state == STATE_PRE_GAP:
-            self.buf.append(cur_frame)
+            self._append(audio)
 
             if vad_res:
                 self.state = STATE_PRE_SPEECH
 
             else:
-                gap_len = len(self.buf) - self.gap_start
+                gap_len = self.buf_frames - self.gap_start
                 if gap_len > self.max_gap:
-                    logging.debug ("*** PRE GAP (%d) TOO LONG at frame %3d ***" % (gap_len, len(self.buf)))
+                    logging.debug ("*** PRE GAP (%d) TOO LONG at frame %3d ***" % (gap_len, self.buf_frames))
                     self.state = STATE_IDLE
 
         elif self.state == STATE_SPEECH:
-            self.buf.append(cur_frame)
+            self._append(audio)
 
             # check if attention span is over
-            if len (self.buf) > self.max_buf_entries:
-                logging.debug ("*** START OF IGNORE at frame %3d ***" % len(self.buf))
+            if self.buf_frames > self.max_buf_entries:
+                logging.debug ("*** START OF IGNORE at frame %3d ***" % self.buf_frames)
                 self.state = STATE_IGNORE
                 return self._return_audio(True)
 
             else:
                 if not vad_res:
-                    logging.debug ("*** START OF GAP at frame %3d ***" % len(self.buf))
+                    logging.debug ("*** START OF GAP at frame %3d ***" % self.buf_frames)
                     self.state     = STATE_GAP
-                    self.gap_start = len(self.buf)
+                    self.gap_start = self.buf_frames
                 return self._return_audio(False)
 
         elif self.state == STATE_GAP:
-            self.buf.append(cur_frame)
+            self._append(audio)
 
-            gap_len = len(self.buf) - self.gap_start
+            gap_len = self.buf_frames - self.gap_start
             if vad_res:
                 self.state = STATE_SPEECH
-                logging.debug ("*** END OF GAP (%d < %d) at frame %3d ***" % (gap_len, self.max_gap, len(self.buf)))
+                logging.debug ("*** END OF GAP (%d < %d) at frame %3d ***" % (gap_len, self.max_gap, self.buf_frames))
                 return self._return_audio(False)
 
             else:
                 if gap_len > self.max_gap:
-                    logging.debug ("*** GAP (%d > %d) TOO LONG at frame %3d ***" % (gap_len, self.max_gap, len(self.buf)))
+                    logging.debug ("*** GAP (%d > %d) TOO LONG at frame %3d ***" % (gap_len, self.max_gap, self.buf_frames))
                     self.state = STATE_IDLE
                     return self._return_audio(True)
                 else:
                     return self._return_audio(False)
 
         elif self.state == STATE_IGNORE:
-            self.buf.append(cur_frame)
+            self.buf_frames += 1
             if not vad_res:
                 self.state     = STATE_IGNORE_GAP
-                self.gap_start = len(self.buf)
+                self.gap_start = self.buf_frames
 
         elif self.state == STATE_IGNORE_GAP:
-            self.buf.append(cur_frame)
+            self.buf_frames += 1
             if vad_res:
                 self.state = STATE_IGNORE
             else:
-                gap_len = len(self.buf) - self.gap_start
+                gap_len = self.buf_frames - self.gap_start
                 if gap_len > self.max_gap:
-                    logging.debug ("*** end of ignore at frame %3d ***" % len(self.buf))
+                    logging.debug ("*** end of ignore at frame %3d ***" % self.buf_frames)
                     self.state = STATE_IDLE
 
         return None, False
 
+
+#
+# VADPool: voice activity detection for many concurrent audio streams
+#
+# frames are submitted in batches of (stream_id, audio) tuples, typically
+# one frame per stream per BUFFER_DURATION tick. Sessions are created on
+# the first frame of a new stream id and evicted after idle_timeout seconds
+# without audio (checked every EVICT_INTERVAL seconds), or least recently
+# used first once max_streams is exceeded. Evicting or closing a stream in
+# the middle of an utterance finalizes it.
+#
+# webrtcvad adapts to the noise level of each stream, so speech
+# classification and the state machine stay per stream; the volume
+# statistics are computed for all frames of a batch in one numpy reduction.
+#
+# process_frames() returns a list of VADEvents in processing order. Like
+# with VAD.process_audio(), event audio is a view which is only valid until
+# the stream's next frame is processed.
+#
+
+VADEvent = namedtuple('VADEvent', ['stream_id', 'audio', 'finalize'])
+
+class VADPool(object):
+
+    def __init__(self, aggressiveness=2, sample_rate=SAMPLE_RATE,
+                 min_utt_length = MIN_UTT_LENGTH,
+                 max_utt_length = MAX_UTT_LENGTH,
+                 max_utt_gap    = MAX_UTT_GAP,
+                 idle_timeout   = IDLE_TIMEOUT,
+                 max_streams    = None):
+
+        self.vad_args     = dict(aggressiveness = aggressiveness,
+                                 sample_rate    = sample_rate,
+                                 min_utt_length = min_utt_length,
+                                 max_utt_length = max_utt_length,
+                                 max_utt_gap    = max_utt_gap)
+
+        self.idle_timeout = idle_timeout
+        self.max_streams  = max_streams
+
+        self.streams      = {}   # stream_id -> VAD
+        self.last_seen    = {}   # stream_id -> time of last frame
+        self.last_evict   = None
+
+    def __len__(self):
+        return len(self.streams)
+
+    def __contains__(self, stream_id):
+        return stream_id in self.streams
+
+    def _close (self, stream_id, events):
+
+        vad = self.streams.pop(stream_id)
+        del self.last_seen[stream_id]
+
+        audio, finalize = vad.flush()
+        if audio is not None:
+            events.append(VADEvent(stream_id, audio, finalize))
+
+    def close_stream (self, stream_id):
+
+        events = []
+        if stream_id in self.streams:
+            self._close(stream_id, events)
+        return events
+
+    def evict_idle (self, now=None):
+
+        if now is None:
+            now = time.time()
+
+        self.last_evict = now
+
+        events = []
+
+        for stream_id, last_seen in list(self.last_seen.items()):
+            if now - last_seen >= self.idle_timeout:
+                logging.debug ('VADPool: evicting idle stream %s' % repr(stream_id))
+                self._close(stream_id, events)
+
+        return events
+
+    def _session (self, stream_id, events):
+
+        if self.max_streams and len(self.streams) >= self.max_streams:
+            lru = min(self.last_seen, key=self.last_seen.get)
+            logging.debug ('VADPool: max streams reached, evicting stream %s' % repr(lru))
+            self._close(lru, events)
+
+        vad = VAD(**self.vad_args)
+        self.streams[stream_id] = vad
+
+        return vad
+
+    def process_frames (self, frames, now=None):
+
+        if now is None:
+            now = time.time()
+
+        events    = []
+        streams   = self.streams
+        last_seen = self.last_seen
+
+        frames = [ (stream_id, np.asarray(audio, dtype=np.int16)) for stream_id, audio in frames ]
+        vads   = []
+
+        for stream_id, audio in frames:
+            vad = streams.get(stream_id)
+            if vad is None:
+                vad = self._session(stream_id, events)
+            last_seen[stream_id] = now
+            vads.append(vad)
+
+        # batched volume statistics for streams still in their statistics phase
+
+        stat = [ i for i, vad in enumerate(vads) if vad.frame_cnt <= FRAME_STAT_CNT ]
+        if stat:
+            lens     = [ len(frames[i][1]) for i in stat ]
+            offsets  = np.cumsum([0] + lens[:-1])
+            vol_sums = np.add.reduceat(np.abs(np.concatenate([ frames[i][1] for i in stat ]).astype(np.int32)), offsets)
+            for i, vol_sum, vol_cnt in zip(stat, vol_sums, lens):
+                vads[i]._volume_stats(float(vol_sum), vol_cnt)
+
+        # state machines
+
+        pending = {} # stream_id -> index of its last event in this batch
+
+        for (stream_id, audio), vad in zip(frames, vads):
+
+            # the stream's buffer may be reused by this frame, detach earlier event audio
+            if stream_id in pending:
+                j = pending.pop(stream_id)
+                events[j] = events[j]._replace(audio=events[j].audio.copy())
+
+            res, finalize = vad._process_frame(audio, vad.vad.is_speech(audio.tobytes(), vad.sample_rate))
+            if res is not None:
+                pending[stream_id] = len(events)
+                events.append(VADEvent(stream_id, res, finalize))
+
+        if self.last_evict is None or now - self.last_evict >= EVICT_INTERVAL:
+            events.extend(self.evict_idle(now))
+
+        return events
+
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# Copyright 2018 Guenter Bartsch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# nltools-vad-segment: offline VAD segmentation of wav files
+#
+# runs the VAD state machine over (memory mapped) 16 bit mono wav files as
+# fast as possible and prints one line per detected utterance:
+#
+# <wav file> <start (s)> <end (s)> [<segment wav file>]
+#
+# optionally each segment is written to a wav file of its own. Directories
+# given on the command line are searched for *.wav files recursively, files
+# are processed in a pool of worker processes.
+#
+
+import os
+import sys
+import wave
+import logging
+import multiprocessing
+
+from optparse    import OptionParser
+
+from nltools.vad     import VAD, MAX_UTT_LENGTH, MAX_UTT_GAP
+from nltools.wavfile import mmap_wav
+
+DEFAULT_AGGRESSIVENESS = 2
+
+def find_wavs (paths):
+
+    wavfns = []
+
+    for path in paths:
+
+        if not os.path.isdir(path):
+            wavfns.append(path)
+            continue
+
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for fn in sorted(filenames):
+                if fn.lower().endswith('.wav'):
+                    wavfns.append(os.path.join(dirpath, fn))
+
+    return wavfns
+
+def segment_wav (args):
+
+    wavfn, outdir, aggressiveness, max_utt_length, max_utt_gap = args
+
+    try:
+        samples, sample_rate = mmap_wav(wavfn)
+
+        vad = VAD(aggressiveness=aggressiveness, sample_rate=sample_rate,
+                  max_utt_length=max_utt_length, max_utt_gap=max_utt_gap)
+
+        segments = []
+
+        for start, end in vad.segment_audio(samples):
+
+            segfn = None
+
+            if outdir:
+                segfn = os.path.join(outdir, '%s-%04d.wav' % (os.path.splitext(os.path.basename(wavfn))[0], len(segments)))
+
+                wavf = wave.open(segfn, 'wb')
+                wavf.setnchannels(1)
+                wavf.setsampwidth(2)
+                wavf.setframerate(sample_rate)
+                wavf.writeframes(samples[start:end].tobytes())
+                wavf.close()
+
+            segments.append((float(start) / sample_rate, float(end) / sample_rate, segfn))
+
+        return wavfn, segments, None
+
+    except Exception as e:
+        return wavfn, None, str(e)
+
+def main (argv=None):
+
+    parser = OptionParser("usage: %prog [options] (foo.wav|dir) ...")
+
+    parser.add_option ("-o", "--output-dir", dest="outdir", type="str",
+                       help="write segments to wav files in this directory")
+
+    parser.add_option ("-a", "--aggressiveness", dest="aggressiveness", type="int", default=DEFAULT_AGGRESSIVENESS,
+                       help="webrtcvad aggressiveness, 0..3 (default: %d)" % DEFAULT_AGGRESSIVENESS)
+
+    parser.add_option ("-m", "--max-utt-length", dest="max_utt_length", type="float", default=MAX_UTT_LENGTH,
+                       help="max utterance length in seconds, longer ones are ignored (default: %s)" % MAX_UTT_LENGTH)
+
+    parser.add_option ("-g", "--max-utt-gap", dest="max_utt_gap", type="float", default=MAX_UTT_GAP,
+                       help="max gap within an utterance in seconds (default: %s)" % MAX_UTT_GAP)
+
+    parser.add_option ("-w", "--workers", dest="workers", type="int", default=0,
+                       help="number of worker processes (default: number of cpus)")
+
+    parser.add_option ("-v", "--verbose", action="store_true", dest="verbose",
+                       help="enable verbose logging")
+
+    (options, args) = parser.parse_args(argv)
+
+    if options.verbose:
+        logging.basicConfig(level=logging.DEBUG)
+    else:
+        logging.basicConfig(level=logging.INFO)
+
+    if not args:
+        parser.print_usage()
+        return 1
+
+    if options.outdir and not os.path.isdir(options.outdir):
+        os.makedirs(options.outdir)
+
+    wavfns  = find_wavs(args)
+    jobs    = [ (wavfn, options.outdir, options.aggressiveness, options.max_utt_length, options.max_utt_gap) for wavfn in wavfns ]
+
+    workers = options.workers or multiprocessing.cpu_count()
+
+    if workers == 1 or len(jobs) < 2:
+        pool    = None
+        results = map(segment_wav, jobs)
+    else:
+        pool    = multiprocessing.Pool(min(workers, len(jobs)))
+        results = pool.imap(segment_wav, jobs)
+
+    errors = 0
+    cnt    = 0
+
+    try:
+        for wavfn, segments, error in results:
+
+            if error:
+                logging.error(error)
+                errors += 1
+                continue
+
+            for start, end, segfn in segments:
+                if segfn:
+                    sys.stdout.write('%s\t%.3f\t%.3f\t%s\n' % (wavfn, start, end, segfn))
+                else:
+                    sys.stdout.write('%s\t%.3f\t%.3f\n' % (wavfn, start, end))
+                cnt += 1
+
+        if pool:
+            pool.close()
+
+    finally:
+        if pool:
+            pool.terminate()
+            pool.join()
+
+    sys.stdout.flush()
+
+    logging.info('%d files, %d segments, %d errors.' % (len(wavfns), cnt, errors))
+
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# Copyright 2018 Guenter Bartsch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# wav file helpers which do not need any audio libraries
+#
+
+import struct
+
+import numpy as np
+
+def mmap_wav (wavfn):
+
+    # memory-map the samples of a 16 bit mono PCM wav file,
+    # returns (samples, sample_rate)
+
+    with open(wavfn, 'rb') as f:
+
+        riff, riff_size, wave_id = struct.unpack('<4sI4s', f.read(12))
+        if riff != b'RIFF' or wave_id != b'WAVE':
+            raise Exception ('%s: not a wav file' % wavfn)
+
+        sample_rate = None
+
+        while True:
+
+            hdr = f.read(8)
+            if len(hdr) < 8:
+                raise Exception ('%s: no data chunk found' % wavfn)
+
+            chunk_id, chunk_size = struct.unpack('<4sI', hdr)
+
+            if chunk_id == b'fmt ':
+                fmt = f.read(chunk_size + chunk_size % 2)
+                audio_format, channels, sample_rate, byte_rate, block_align, bits = struct.unpack('<HHIIHH', fmt[:16])
+                if not audio_format in (1, 0xfffe) or channels != 1 or bits != 16:
+                    raise Exception ('%s: 16 bit mono PCM expected' % wavfn)
+
+            elif chunk_id == b'data':
+                if sample_rate is None:
+                    raise Exception ('%s: data chunk before fmt chunk' % wavfn)
+                offset = f.tell()
+                break
+
+            else:
+                f.seek(chunk_size + chunk_size % 2, 1)
+
+        # streaming writers may leave the data size unset (0 or 0xFFFFFFFF):
+        # samples extend to the end of the file then
+
+        f.seek(0, 2)
+        nsamples = f.tell() - offset
+        if not chunk_size in (0, 0xFFFFFFFF):
+            nsamples = min(chunk_size, nsamples)
+        nsamples //= 2
+
+    if nsamples == 0:
+        return np.zeros(0, dtype=np.int16), sample_rate
+
+    return np.memmap(wavfn, dtype='<i2', mode='r', offset=offset, shape=(nsamples,)), sample_rate
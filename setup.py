@@ -11,6 +11,14 @@ setup(
     maintainer_email     = 'guenter@zamia.org',
     url                  = 'https://github.com/gooofy/py-nltools',
     packages             = ['nltools'],
+    package_data         = {'nltools': ['data/*.tsv']},
+    entry_points         = {
+                               'console_scripts': [
+                                   'nltools-tokenize = nltools.tokenize_corpus:main',
+                                   'nltools-vad-segment = nltools.vad_segment:main',
+                                   'nltools-asr-server = nltools.asr_server:main',
+                               ],
+                           },
     install_requires     = [
                             'num2words', 'py-marytts', 'py-picotts', 'py-espeak-ng', 'pocketsphinx', 'py-kaldi-asr', 'numpy', 'webrtcvad', 'setproctitle'
                            ],
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*- 
+
+#
+# Copyright 2018 Guenter Bartsch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+#
+# test helper: load private copies of nltools.pulseplayer / pulserecorder
+# which call a python stub instead of libpulse, so their buffering and
+# threading logic can be tested without a pulseaudio server
+#
+
+import os
+import ctypes
+
+class PulseStub(object):
+
+    # every libpulse function is a no-op returning 0 unless given as a
+    # keyword argument (plain functions, the modules set restype/argtypes
+    # on them)
+
+    def __init__(self, **funcs):
+        self.__dict__.update(funcs)
+
+    def __getattr__(self, name):
+
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        def f(*args):
+            return 0
+
+        setattr(self, name, f)
+        return f
+
+def load_module(name, stub):
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'nltools', name + '.py')
+
+    load_library = ctypes.cdll.LoadLibrary
+    ctypes.cdll.LoadLibrary = lambda libname: stub
+
+    try:
+        try:
+            import importlib.util
+            spec   = importlib.util.spec_from_file_location('pulse_stub_' + name, path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except ImportError:
+            import imp
+            module = imp.load_source('pulse_stub_' + name, path)
+    finally:
+        ctypes.cdll.LoadLibrary = load_library
+
+    return module
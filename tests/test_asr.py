@@ -22,6 +22,8 @@ import logging
 import wave
 import struct
 
+import numpy as np
+
 from nltools.asr import ASR, ASR_ENGINE_NNET3, ASR_ENGINE_POCKETSPHINX
 from nltools     import misc
 
@@ -74,6 +76,89 @@ class TestASR (unittest.TestCase):
         s, l = asr.decode_wav_file(TEST_WAVE_EN)
         self.assertEqual(s.strip(), TEST_WAVE_EN_TS)
 
+    def test_asr_kaldi_wavefiles(self):
+        asr = ASR(engine = ASR_ENGINE_NNET3)
+        res = list(asr.decode_wav_files([TEST_WAVE_EN, TEST_WAVE_EN], workers=2))
+        self.assertEqual(len(res), 2)
+        for wavfile, s, l, t in res:
+            self.assertEqual(wavfile, TEST_WAVE_EN)
+            self.assertEqual(s.strip(), TEST_WAVE_EN_TS)
+
+    def test_asr_kaldi_wavestream(self):
+        asr = ASR(engine = ASR_ENGINE_NNET3)
+        res = list(asr.decode_wav_stream(TEST_WAVE_EN, chunk_length=0.25, partial=True))
+        s, l, final = res[-1]
+        self.assertTrue(final)
+        self.assertEqual(s.strip(), TEST_WAVE_EN_TS)
+        for s, l, final in res[:-1]:
+            self.assertFalse(final)
+
+        s, l = asr.decode_wav_file(TEST_WAVE_EN, chunk_length=0.25)
+        self.assertEqual(s.strip(), TEST_WAVE_EN_TS)
+
+    def test_asr_kaldi_buffers(self):
+
+        asr = ASR(engine = ASR_ENGINE_NNET3)
+
+        wavf = wave.open(TEST_WAVE_EN, 'rb')
+        frames = wavf.readframes(wavf.getnframes())
+        sample_rate = wavf.getframerate()
+        wavf.close()
+
+        # 16 bit PCM bytes, int16 and float32 arrays
+
+        for audio in [frames, np.frombuffer(frames, dtype=np.int16), np.frombuffer(frames, dtype=np.int16).astype(np.float32)]:
+            s, l = asr.decode(audio, True, sample_rate)
+            self.assertEqual(s.strip(), TEST_WAVE_EN_TS)
+
+    def test_asr_kaldi_streams(self):
+
+        asr = ASR(engine = ASR_ENGINE_NNET3, max_streams = 2, stream_wait = 0.1)
+
+        wavf = wave.open(TEST_WAVE_EN, 'rb')
+        samples = np.frombuffer(wavf.readframes(wavf.getnframes()), dtype=np.int16)
+        sample_rate = wavf.getframerate()
+        wavf.close()
+
+        # two interleaved streams
+
+        half = len(samples) // 2
+        asr.decode(samples[:half], False, sample_rate, stream_id='a')
+        asr.decode(samples[:half], False, sample_rate, stream_id='b')
+        self.assertEqual(len(asr), 2)
+
+        # stream limit reached
+        with self.assertRaises(Exception):
+            asr.decode(samples[:half], False, sample_rate, stream_id='c')
+
+        s, l = asr.decode(samples[half:], True, sample_rate, stream_id='a')
+        self.assertEqual(s.strip(), TEST_WAVE_EN_TS)
+
+        # finalized decoder is recycled
+        self.assertEqual(len(asr), 1)
+        self.assertEqual(len(asr.free_decoders), 1)
+
+        asr.close_stream('b')
+        self.assertFalse('b' in asr)
+
+        s, l = asr.decode(samples, True, sample_rate, stream_id='c')
+        self.assertEqual(s.strip(), TEST_WAVE_EN_TS)
+
+    def test_asr_kaldi_wavestream_abandoned(self):
+
+        asr = ASR(engine = ASR_ENGINE_NNET3)
+
+        # abandon a stream halfway, must not affect the next decode
+
+        stream = asr.decode_wav_stream(TEST_WAVE_EN, chunk_length=0.1, partial=True)
+        next(stream)
+        stream.close()
+
+        self.assertEqual(len(asr), 0)
+
+        s, l = asr.decode_wav_file(TEST_WAVE_EN)
+        self.assertEqual(s.strip(), TEST_WAVE_EN_TS)
+
     def test_asr_pocketsphinx(self):
 
         asr = ASR(engine = ASR_ENGINE_POCKETSPHINX, model_dir = POCKETSPHINX_MODELDIR, model_name = POCKETSPHINX_MODELNAME)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*- 
+
+#
+# Copyright 2018 Guenter Bartsch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+import logging
+import wave
+import time
+import socket
+
+from threading          import Thread, Event
+
+from nltools.asr        import ASR, ASR_ENGINE_NNET3
+from nltools.asr_server import ASRServer, ASRClient
+
+TEST_WAVE_EN       = 'tests/foo.wav'
+TEST_WAVE_EN_TS    = 'ah indeed'
+
+RESPONSE           = b'{"hstr": "ah indeed", "confidence": 1.0, "final": true}'
+
+class FakeServer(Thread):
+
+    # minimal HTTP server for ASRClient connection handling tests: answers
+    # <answer> requests per connection, then closes it (hang: reads one more
+    # request and never answers it)
+
+    def __init__(self, answer=1, hang=False):
+
+        Thread.__init__(self)
+
+        self.answer   = answer
+        self.hang     = hang
+        self.requests = 0
+        self.conns    = 0
+        self.closed   = Event()
+        self.stop     = Event()
+        self.daemon   = True
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(('localhost', 0))
+        self.sock.listen(5)
+        self.port = self.sock.getsockname()[1]
+
+    def _read_request(self, f):
+
+        length = 0
+        while True:
+            line = f.readline()
+            if not line:
+                return False
+            if line.lower().startswith(b'content-length:'):
+                length = int(line.split(b':')[1])
+            if line in (b'\r\n', b'\n'):
+                break
+        f.read(length)
+
+        self.requests += 1
+        return True
+
+    def run(self):
+
+        while True:
+            conn, addr = self.sock.accept()
+            self.conns += 1
+            f = conn.makefile('rb')
+
+            for i in range(self.answer):
+
+                if not self._read_request(f):
+                    break
+
+                conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n' % len(RESPONSE) + RESPONSE)
+
+            if self.hang and self._read_request(f):
+                self.stop.wait()
+
+            f.close()
+            conn.close()
+            self.closed.set()
+
+class TestASRServer (unittest.TestCase):
+
+    def test_asr_server(self):
+
+        server = ASRServer(ASR(engine = ASR_ENGINE_NNET3), port=0, workers=2)
+        thread = Thread(target=server.serve_forever)
+        thread.start()
+
+        try:
+            client = ASRClient(port=server.server_address[1])
+
+            wavf = wave.open(TEST_WAVE_EN, 'rb')
+            sample_rate = wavf.getframerate()
+            frames = wavf.readframes(wavf.getnframes())
+            wavf.close()
+
+            # two streams, interleaved 250ms chunks
+
+            chunk_size = 250 * sample_rate // 1000 * 2
+
+            for pos in range(0, len(frames), chunk_size):
+                finalize = pos + chunk_size >= len(frames)
+                for stream_id in ['a', 'b']:
+                    s, l = client.decode(frames[pos:pos+chunk_size], finalize, sample_rate, stream_id)
+
+                    if finalize:
+                        self.assertEqual(s.strip(), TEST_WAVE_EN_TS)
+
+            client.decode(frames, False, sample_rate, 'c')
+            self.assertTrue('c' in server.asr)
+            client.close_stream('c')
+            self.assertFalse('c' in server.asr)
+
+            client.close()
+
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+class TestASRClient (unittest.TestCase):
+
+    def test_reconnect(self):
+
+        server = FakeServer(answer=1)
+        server.start()
+
+        client = ASRClient(port=server.port)
+
+        self.assertEqual(client.decode(b'\0\0', True), ('ah indeed', 1.0))
+
+        # server closes the idle keep-alive connection: resend once
+
+        server.closed.wait(5)
+        self.assertEqual(client.decode(b'\0\0', True), ('ah indeed', 1.0))
+
+        self.assertEqual(server.requests, 2)
+        self.assertEqual(server.conns, 2)
+
+        client.close()
+
+    def test_timeout(self):
+
+        server = FakeServer(answer=1, hang=True)
+        server.start()
+
+        client = ASRClient(port=server.port, timeout=0.2)
+
+        self.assertEqual(client.decode(b'\0\0', True), ('ah indeed', 1.0))
+
+        # timeout on the kept-alive connection: the request may have been
+        # decoded already, no retry
+
+        start_time = time.time()
+        with self.assertRaises(socket.timeout):
+            client.decode(b'\0\0', True)
+
+        self.assertLess(time.time() - start_time, 0.4)
+        self.assertEqual(server.requests, 2)
+        self.assertEqual(server.conns, 1)
+
+        server.stop.set()
+        client.close()
+
+if __name__ == "__main__":
+
+    logging.basicConfig(level=logging.ERROR)
+
+    unittest.main()
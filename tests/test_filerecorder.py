@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*- 
+
+#
+# Copyright 2018 Guenter Bartsch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import sys
+import unittest
+import logging
+import tempfile
+import shutil
+import wave
+import time
+import os
+
+import numpy as np
+
+from nltools.filerecorder import FileRecorder, MIX_MODE_RIGHT, OVERFLOW_BLOCK
+
+# async for is a syntax error on python 2
+
+ASYNC_CONSUMER = """
+async def consume(frames, out):
+    async for buf in frames:
+        out.append(buf)
+"""
+
+SAMPLE_RATE = 16000
+
+def write_wav(wavfn, samples, channels=1):
+
+    wavf = wave.open(wavfn, 'wb')
+    wavf.setnchannels(channels)
+    wavf.setsampwidth(2)
+    wavf.setframerate(SAMPLE_RATE)
+    wavf.writeframes(samples.astype('<i2').tobytes())
+    wavf.close()
+
+class TestFileRecorder (unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_replay(self):
+
+        os.mkdir(os.path.join(self.tmpdir, 'wav'))
+
+        write_wav(os.path.join(self.tmpdir, 'wav', 'a.wav'), np.arange(1000))
+        write_wav(os.path.join(self.tmpdir, 'wav', 'b.wav'), np.arange(1000, 1500))
+        with open(os.path.join(self.tmpdir, 'c.raw'), 'wb') as f:
+            f.write(np.arange(1500, 1600).astype('<i2').tobytes())
+
+        rec = FileRecorder([os.path.join(self.tmpdir, 'wav'), os.path.join(self.tmpdir, 'c.raw')])
+        rec.start_recording()
+
+        bufs = list(rec.frames())
+
+        # 1600 samples in 480 sample buffers, last one zero padded
+        self.assertEqual ([ len(buf) for buf in bufs ], [480] * 4)
+        samples = np.concatenate(bufs)
+        self.assertTrue ((samples[:1600] == np.arange(1600)).all())
+        self.assertTrue ((samples[1600:] == 0).all())
+
+        with self.assertRaises(EOFError):
+            rec.get_samples()
+
+        rec.stop_recording()
+
+    def test_stereo(self):
+
+        wavfn = os.path.join(self.tmpdir, 'stereo.wav')
+
+        # interleaved: left = 1, right = 2
+        write_wav(wavfn, np.tile([1, 2], 480), channels=2)
+
+        rec = FileRecorder(wavfn)
+        rec.start_recording(mix_mode=MIX_MODE_RIGHT)
+        self.assertTrue ((rec.get_samples() == 2).all())
+        rec.stop_recording()
+
+        # no resampling
+        rec = FileRecorder(wavfn, rate=8000)
+        rec.start_recording()
+        with self.assertRaises(Exception):
+            rec.get_samples()
+
+    def test_realtime(self):
+
+        wavfn = os.path.join(self.tmpdir, 'a.wav')
+        write_wav(wavfn, np.zeros(4800))
+
+        rec = FileRecorder(wavfn, realtime=True)
+        rec.start_recording()
+
+        start = time.time()
+        self.assertEqual (len(list(rec.frames())), 10)
+        self.assertTrue (time.time() - start >= 0.25)
+
+    def test_pulserecorder_args(self):
+
+        wavfn = os.path.join(self.tmpdir, 'a.wav')
+        write_wav(wavfn, np.zeros(960))
+
+        # PulseRecorder's buffer queue arguments are accepted
+
+        rec = FileRecorder(wavfn)
+        rec.start_recording(480, max_buffers=10, overflow=OVERFLOW_BLOCK)
+        self.assertEqual (len(list(rec.frames())), 2)
+        rec.stop_recording()
+
+    @unittest.skipIf(sys.version_info < (3, 5), 'async for needs python 3.5+')
+    def test_frames_async(self):
+
+        import asyncio
+
+        ns = {}
+        exec(ASYNC_CONSUMER, ns)
+
+        wavfn = os.path.join(self.tmpdir, 'a.wav')
+        write_wav(wavfn, np.arange(1000))
+
+        rec = FileRecorder(wavfn)
+        rec.start_recording()
+
+        out  = []
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(ns['consume'](rec.frames(), out))
+        loop.close()
+
+        self.assertEqual ([ len(buf) for buf in out ], [480] * 3)
+        self.assertTrue ((np.concatenate(out)[:1000] == np.arange(1000)).all())
+
+if __name__ == "__main__":
+
+    logging.basicConfig(level=logging.ERROR)
+    
+    unittest.main()
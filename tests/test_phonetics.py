@@ -19,7 +19,8 @@
 
 import logging
 import unittest
-from nltools.phonetics import ipa2xsampa, ipa2mary, xsampa2xarpabet, xs2xa_table, xsampa2ipa
+from nltools.phonetics import ipa2xsampa, ipa2mary, xsampa2xarpabet, xs2xa_table, xsampa2ipa, ipa2espeak, espeak2ipa, convert_lexicon
+from nltools.phonetics import xarpabet_cache
 
 class TestPhoneticAlphabets (unittest.TestCase):
 
@@ -88,6 +89,21 @@ class TestPhoneticAlphabets (unittest.TestCase):
         #print "res: %s" % res
         self.assertEqual (res, u"ɑ̃tʁe")
 
+    def test_espeak(self):
+
+        res = ipa2espeak ("EISENBAHN", u"ˈaɪ̯zən̩ˌbaːn")
+        #print "res: %s" % res
+        self.assertEqual (res, "'aIz@nba:n")
+
+        res = espeak2ipa ("EISENBAHN", "'aIz@nba:n")
+        #print "res: %s" % res
+        self.assertEqual (res, u"'aɪzənbæːn")
+
+        # unknown phonemes are reported, not skipped
+
+        with self.assertRaises(Exception):
+            ipa2xsampa ("UNKNOWN", u"aQ")
+
     def test_xarpa(self):
 
         res = xsampa2xarpabet ("JAHRHUNDERTE", "ja:6-'hUn-d6-t@")
@@ -126,6 +142,51 @@ class TestPhoneticAlphabets (unittest.TestCase):
         #print "res: %s" % res
         self.assertEqual (res, "P W AH NJ AN")
 
+    def test_convert_lexicon(self):
+
+        entries = [ ("EISENBAHN", u"ˈaɪ̯zən̩ˌbaːn"),
+                    ("UNKNOWN",   u"aQ"),
+                    ("BON",       u"bɔ̃") ] * 10
+
+        for workers in [1, 2]:
+
+            results, errors = convert_lexicon (entries, src='ipa', dst='xsampa', workers=workers, chunksize=4)
+
+            self.assertEqual (len(results), 20)
+            self.assertEqual (results[0], ("EISENBAHN", "'aIz@nba:n"))
+            self.assertEqual (results[1], ("BON", "bO~"))
+
+            self.assertEqual (len(errors), 10)
+            self.assertEqual (errors[0][0], "UNKNOWN")
+            self.assertEqual (errors[0][1], u"aQ")
+            self.assertTrue (u'Phoneme not found: Q' in errors[0][2])
+
+        results, errors = convert_lexicon (entries[:1], src='ipa', dst='xarpabet', workers=1)
+        self.assertEqual (results, [("EISENBAHN", "AY Z AX N B AAH N")])
+        self.assertEqual (errors, [])
+
+        with self.assertRaises(Exception):
+            convert_lexicon (entries, src='xarpabet', dst='ipa')
+
+    def test_xarpa_cache(self):
+
+        xarpabet_cache.clear()
+
+        res = xsampa2xarpabet ("JAHRHUNDERTE", "ja:6-'hUn-d6-t@")
+        self.assertEqual (res, "Y AAH EX HH UU N D EX T AX")
+        self.assertEqual (xarpabet_cache["ja:6-'hUn-d6-t@"], res)
+
+        res = xsampa2xarpabet ("JAHRHUNDERTE", "ja:6-'hUn-d6-t@")
+        self.assertEqual (res, "Y AAH EX HH UU N D EX T AX")
+
+        # failed conversions are not cached
+
+        with self.assertRaises(Exception):
+            xsampa2xarpabet ("UNKNOWN", "a%")
+        with self.assertRaises(Exception):
+            xsampa2xarpabet ("UNKNOWN", "a%")
+        self.assertFalse ("a%" in xarpabet_cache)
+
     def test_xarpa_unique(self):
 
         # all xarpa transcriptions have to be unique
@@ -19,11 +19,24 @@
 
 import unittest
 import logging
+import wave
+import time
 
-from nltools.pulseplayer import PulsePlayer
+from io         import BytesIO
+
+from threading  import Event
+
+from pulse_stub import PulseStub, load_module
 
 class TestPulsePlayer (unittest.TestCase):
 
+    # these need a pulseaudio server
+
+    @classmethod
+    def setUpClass(cls):
+        global PulsePlayer
+        from nltools.pulseplayer import PulsePlayer
+
     def test_playback(self):
 
         player = PulsePlayer('nltools unittest')
@@ -33,6 +46,218 @@ class TestPulsePlayer (unittest.TestCase):
 
             player.play(wav)
 
+    def test_queue(self):
+
+        player = PulsePlayer('nltools unittest')
+
+        with open('foo.wav', 'rb') as wavf:
+            wav = wavf.read()
+
+        # gapless back-to-back playback on a single stream
+
+        player.play(wav, enqueue=True)
+        player.play(wav, enqueue=True)
+        player.wait()
+
+        self.assertFalse (player.playing)
+        self.assertEqual (len(player.streams), 1)
+
+        player.close()
+
+    def test_stream(self):
+
+        player = PulsePlayer('nltools unittest')
+
+        wavf = wave.open('foo.wav', 'rb')
+
+        def chunks():
+            while True:
+                buf = wavf.readframes(333)
+                if not buf:
+                    break
+                yield buf
+
+        player.play_stream(chunks(), wavf.getframerate(), wavf.getnchannels(), async=False)
+
+        self.assertFalse (player.playing)
+
+        wavf.close()
+        player.close()
+
+    def test_stop(self):
+
+        player = PulsePlayer('nltools unittest')
+
+        with open('foo.wav', 'rb') as wavf:
+            wav = wavf.read()
+
+        player.play(wav, enqueue=True)
+        player.play(wav, enqueue=True)
+
+        self.assertGreater (player.remaining(), 0.0)
+
+        player.pause()
+        pos = player.position()
+        self.assertTrue (player.paused)
+        player.resume()
+
+        self.assertGreaterEqual (player.position(), pos)
+
+        # barge-in
+
+        player.stop()
+
+        self.assertFalse (player.playing)
+        self.assertEqual (player.position(), None)
+        self.assertEqual (player.remaining(), None)
+
+        player.close()
+
+#
+# barge-in with a slow play_stream() producer, against a libpulse-simple stub
+#
+
+LATENCY = 0.1 # seconds
+
+class TestPulsePlayerStub (unittest.TestCase):
+
+    def setUp(self):
+
+        self.calls = []
+
+        def write(s, buf, l, error):
+            time.sleep(0.001)
+            self.calls.append(buf)
+            return 0
+
+        def flush(s, error):
+            self.calls.append('flush')
+            return 0
+
+        self.stream = 1
+
+        stub = PulseStub(pa_simple_new         = lambda *args: self.stream,
+                         pa_simple_write       = write,
+                         pa_simple_flush       = flush,
+                         pa_simple_get_latency = lambda s, error: int(LATENCY * 1000000))
+
+        self.pp     = load_module('pulseplayer', stub)
+        self.player = self.pp.PulsePlayer('nltools unittest')
+        self.gate   = Event()
+
+    def tearDown(self):
+        self.gate.set()
+        self.player.close()
+
+    def _chunks(self, n):
+
+        # n chunks, then block until the gate opens, then one more
+
+        for i in range(n):
+            yield bytearray([i+1]) * 2048
+
+        self.gate.wait(10)
+
+        yield bytearray([0xff]) * 2048
+
+    def _wait_writes(self, n):
+        for i in range(1000):
+            if len(self.calls) >= n and self.player.pulling:
+                return
+            time.sleep(0.001)
+        self.fail('playback thread did not get to write %d chunks' % n)
+
+    def test_stop_slow_stream(self):
+
+        self.player.play_stream(self._chunks(3), 16000)
+        self._wait_writes(3)
+
+        start_time = time.time()
+        self.player.stop()
+
+        # no waiting for the producer, buffered audio discarded
+
+        self.assertLess (time.time() - start_time, 0.5)
+        self.assertEqual (self.calls[-1], 'flush')
+        self.assertFalse (self.player.playing)
+
+        # the chunk produced after stop() is not played
+
+        self.gate.set()
+        self.player.close()
+
+        self.assertEqual (len([c for c in self.calls if c != 'flush']), 3)
+
+    def test_pause_slow_stream(self):
+
+        self.player.play_stream(self._chunks(3), 16000)
+        self._wait_writes(3)
+
+        start_time = time.time()
+        self.player.pause()
+
+        self.assertLess (time.time() - start_time, 0.5)
+        self.assertEqual (self.calls[-1], 'flush')
+
+        # the chunk produced while paused is held back
+
+        self.gate.set()
+        time.sleep(0.1)
+        self.assertEqual (self.calls[-1], 'flush')
+
+        self.player.resume()
+        self.player.wait()
+
+        # replay: the audio flushed (LATENCY seconds), then the new chunk
+
+        written = b''.join(bytes(c) for c in self.calls[:3])
+        n       = int(LATENCY * 16000) * 2
+        resumed = b''.join(bytes(c) for c in self.calls[4:])
+
+        self.assertEqual (resumed, written[-n:] + bytes(bytearray([0xff]) * 2048))
+
+    def test_stream_error(self):
+
+        # stream setup errors are raised to the caller
+
+        self.stream = 0
+
+        with self.assertRaises(Exception):
+            self.player.play_stream([b'\0' * 2048], 16000, async=False)
+
+        self.assertFalse (self.player.playing)
+        self.assertEqual (self.player.thread, None)
+
+    def test_thread(self):
+
+        wav = BytesIO()
+        wf  = wave.open(wav, 'wb')
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(b'\1' * 8192)
+        wf.close()
+
+        # not a daemon thread: async playback finishes before the
+        # interpreter exits
+
+        self.player.play(wav.getvalue())
+
+        thread = self.player.thread
+        self.assertFalse (thread.daemon)
+
+        # ends once everything has been played
+
+        thread.join(5)
+        self.assertFalse (thread.is_alive())
+        self.assertFalse (self.player.playing)
+        self.assertEqual (len(self.calls), 4)
+
+        # the next play() starts a new one
+
+        self.player.play(wav.getvalue(), async=False)
+        self.assertEqual (len(self.calls), 8)
+
 if __name__ == "__main__":
 
     logging.basicConfig(level=logging.ERROR)
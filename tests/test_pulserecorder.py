@@ -17,11 +17,25 @@
 # limitations under the License.
 #
 
+import sys
 import unittest
 import logging
 import time
+import ctypes
 
-from nltools.pulserecorder import PulseRecorder
+import numpy as np
+
+from threading  import Thread
+
+from pulse_stub import PulseStub, load_module
+
+# async for is a syntax error on python 2
+
+ASYNC_CONSUMER = """
+async def consume(frames, out):
+    async for buf in frames:
+        out.append(int(buf[0]))
+"""
 
 SOURCE              = 'Monitor'
 SAMPLERATE          = 16000
@@ -29,6 +43,13 @@ VOLUME              = 120
 
 class TestPulseRecorder (unittest.TestCase):
 
+    # these need a pulseaudio server
+
+    @classmethod
+    def setUpClass(cls):
+        global PulseRecorder
+        from nltools.pulserecorder import PulseRecorder
+
     def test_rec(self):
 
         recorder = PulseRecorder(source_name=SOURCE, rate=SAMPLERATE, volume=VOLUME)
@@ -43,6 +64,272 @@ class TestPulseRecorder (unittest.TestCase):
         self.assertGreater (len(samples), 900)
         
 
+#
+# buffering and mixing logic, against a libpulse stub: a single source is
+# reported synchronously from pa_threaded_mainloop_start(), audio
+# fragments are fed by calling stream_read_cb() directly
+#
+
+class TestPulseRecorderStub (unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cbs = {}
+
+        def set_state_callback(context, cb, userdata):
+            cbs['state'] = cb
+
+        def mainloop_start(mainloop):
+            cbs['state'](None, None)
+            return 0
+
+        def get_source_info_list(context, cb, userdata):
+
+            info = cls.pr.pa_source_info()
+            info.index           = 1
+            info.name            = b'stub'
+            info.description     = b'stub source'
+            info.monitor_of_sink = cls.pr.PA_INVALID_INDEX
+
+            cb(None, ctypes.pointer(info), 0, None)
+            cb(None, None, 1, None)
+
+        def stream_peek(stream, data, nbytes):
+            data.value   = ctypes.addressof(cls.fragment)
+            nbytes.value = ctypes.sizeof(cls.fragment)
+            return 0
+
+        stub = PulseStub(pa_context_set_state_callback   = set_state_callback,
+                         pa_threaded_mainloop_start      = mainloop_start,
+                         pa_context_get_state            = lambda context: cls.pr.PA_CONTEXT_READY,
+                         pa_context_get_source_info_list = get_source_info_list,
+                         pa_stream_peek                  = stream_peek)
+
+        cls.pr = load_module('pulserecorder', stub)
+
+    def _recorder(self, **kwargs):
+
+        rec = self.pr.PulseRecorder()
+        rec.start_recording(**kwargs)
+
+        self.assertEqual(rec.source_idx, 1)
+
+        return rec
+
+    def _feed_bytes(self, rec, data):
+
+        self.__class__.fragment = (ctypes.c_char * len(data)).from_buffer_copy(data)
+
+        rec.stream_read_cb(None, len(data), 1)
+
+    def _feed(self, rec, samples):
+
+        # one fragment of (interleaved, if recording stereo) samples
+
+        self._feed_bytes(rec, np.asarray(samples, dtype='<i2').tobytes())
+
+    def _feed_buffers(self, rec, first, n):
+
+        # n buffers of 10 samples, buffer i filled with value i
+
+        for i in range(first, first+n):
+            self._feed(rec, [i] * 10)
+
+    def test_overflow_drop_oldest(self):
+
+        rec = self._recorder(frames_per_buffer=10, max_buffers=3, overflow=self.pr.OVERFLOW_DROP_OLDEST)
+
+        self._feed_buffers(rec, 0, 5)
+
+        self.assertEqual(rec.overruns, 2)
+        self.assertEqual([rec.get_samples()[0] for i in range(3)], [2, 3, 4])
+
+        rec.stop_recording()
+
+    def test_overflow_drop_newest(self):
+
+        rec = self._recorder(frames_per_buffer=10, max_buffers=3, overflow=self.pr.OVERFLOW_DROP_NEWEST)
+
+        self._feed_buffers(rec, 0, 5)
+
+        self.assertEqual(rec.overruns, 2)
+        self.assertEqual([rec.get_samples()[0] for i in range(3)], [0, 1, 2])
+
+        rec.stop_recording()
+
+    def test_overflow_block(self):
+
+        rec = self._recorder(frames_per_buffer=10, max_buffers=3, overflow=self.pr.OVERFLOW_BLOCK)
+
+        # the 4th buffer blocks the callback until a buffer is consumed
+
+        feeder = Thread(target=self._feed_buffers, args=(rec, 0, 4))
+        feeder.start()
+        time.sleep(0.1)
+
+        self.assertTrue(feeder.is_alive())
+        self.assertEqual(rec.overruns, 1)
+
+        self.assertEqual(rec.get_samples()[0], 0)
+        feeder.join(5)
+        self.assertFalse(feeder.is_alive())
+
+        self.assertEqual([rec.get_samples()[0] for i in range(3)], [1, 2, 3])
+
+        # stop_recording() wakes up a blocked callback
+
+        feeder = Thread(target=self._feed_buffers, args=(rec, 4, 4))
+        feeder.start()
+        time.sleep(0.1)
+        self.assertTrue(feeder.is_alive())
+
+        rec.stop_recording()
+        feeder.join(5)
+        self.assertFalse(feeder.is_alive())
+        self.assertEqual(rec.overruns, 2)
+
+    def test_release(self):
+
+        rec = self._recorder(frames_per_buffer=10)
+
+        self._feed_buffers(rec, 0, 1)
+        buf = rec.get_samples()
+        rec.release(buf)
+
+        # released buffer becomes the buffer being filled, then is queued again
+
+        self._feed_buffers(rec, 1, 2)
+
+        self.assertIsNot(rec.get_samples(), buf)
+        buf2 = rec.get_samples()
+        self.assertIs(buf2, buf)
+        self.assertEqual(list(buf2), [2] * 10)
+
+        # buffers of the wrong size are not recycled
+
+        rec.release(np.zeros(5, dtype=np.int16))
+        self.assertEqual(len(rec._pool), 0)
+
+        rec.stop_recording()
+
+    def _feed_later(self, rec, first, n, stop=True):
+
+        # feed from another thread (like the pulseaudio mainloop), then stop
+
+        def feed():
+            time.sleep(0.1)
+            self._feed_buffers(rec, first, n)
+            time.sleep(0.1)
+            if stop:
+                rec.stop_recording()
+
+        feeder = Thread(target=feed)
+        feeder.start()
+        return feeder
+
+    def test_frames(self):
+
+        rec = self._recorder(frames_per_buffer=10)
+
+        self._feed_buffers(rec, 0, 2)
+        feeder = self._feed_later(rec, 2, 1)
+
+        # blocks for the 3rd buffer, ends once recording has stopped
+
+        self.assertEqual([int(buf[0]) for buf in rec.frames()], [0, 1, 2])
+
+        feeder.join()
+
+        # not recording: ends right away
+        self.assertEqual(list(rec.frames()), [])
+
+    @unittest.skipIf(sys.version_info < (3, 5), 'async for needs python 3.5+')
+    def test_frames_async(self):
+
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        ns = {}
+        exec(ASYNC_CONSUMER, ns)
+
+        loop = asyncio.new_event_loop()
+
+        # buffers are handed over via call_soon_threadsafe(), a busy
+        # executor must not delay them
+
+        loop.set_default_executor(ThreadPoolExecutor(1))
+        for i in range(3):
+            loop.run_in_executor(None, time.sleep, 1)
+
+        rec = self._recorder(frames_per_buffer=10)
+
+        self._feed_buffers(rec, 0, 2)
+        feeder = self._feed_later(rec, 2, 1)
+
+        out = []
+        start_time = time.time()
+        loop.run_until_complete(asyncio.wait_for(ns['consume'](rec.frames(), out), 5))
+
+        self.assertEqual(out, [0, 1, 2])
+        self.assertLess(time.time() - start_time, 0.9)
+
+        feeder.join()
+
+        # stop_recording() ends a consumer waiting for the next buffer
+
+        rec = self._recorder(frames_per_buffer=10)
+        feeder = Thread(target=lambda: (time.sleep(0.1), rec.stop_recording()))
+        feeder.start()
+
+        out = []
+        loop.run_until_complete(asyncio.wait_for(ns['consume'](rec.frames(), out), 5))
+        self.assertEqual(out, [])
+
+        feeder.join()
+        loop.close()
+
+    def _mix_reference(self, data, mix_mode):
+
+        # the per-sample loop stream_read_cb() used to run
+
+        data = bytearray(data)
+
+        bytes_per_sample = 2 if mix_mode == self.pr.MIX_MODE_BOTH else 4
+        off_low, off_high = (2, 3) if mix_mode == self.pr.MIX_MODE_RIGHT else (0, 1)
+
+        samples = []
+        for i in range(len(data) // bytes_per_sample):
+            sample = data[i*bytes_per_sample+off_low] + 256 * data[i*bytes_per_sample+off_high]
+            samples.append(sample - 65536 if sample > 32767 else sample)
+
+        return samples
+
+    def test_mix_modes(self):
+
+        rs = np.random.RandomState(42)
+
+        for mix_mode in [self.pr.MIX_MODE_BOTH, self.pr.MIX_MODE_LEFT, self.pr.MIX_MODE_RIGHT]:
+
+            rec = self._recorder(frames_per_buffer=100, mix_mode=mix_mode, max_buffers=0)
+
+            expected = []
+
+            # fragments of random length, including incomplete samples
+
+            for i in range(50):
+                data = rs.randint(0, 256, size=rs.randint(1, 400)).astype(np.uint8).tobytes()
+                expected.extend(self._mix_reference(data, mix_mode))
+                self._feed_bytes(rec, data)
+
+            rec.stop_recording()
+
+            got = [int(sample) for buf in rec.frames() for sample in buf]
+
+            self.assertGreater(len(got), 1000)
+            self.assertEqual(got, expected[:len(got)])
+            self.assertLess(len(expected) - len(got), 100)
+
 if __name__ == "__main__":
 
     logging.basicConfig(level=logging.DEBUG)
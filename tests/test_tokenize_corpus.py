@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*- 
+
+#
+# Copyright 2018 Guenter Bartsch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+import logging
+import tempfile
+import shutil
+import gzip
+import bz2
+import io
+import os
+
+from nltools.tokenize_corpus import main
+
+CORPUS = u"Mein Name ist HAL 9000.\n\nz.B. 42 Äpfel, u.a. Birnen!\n"
+TOKENS = u"mein name ist hal neuntausend\n\nzum beispiel zweiundvierzig äpfel unter anderem birnen\n"
+
+class TestTokenizeCorpus (unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_tokenize_corpus(self):
+
+        fns = [os.path.join(self.tmpdir, 'corpus.txt'), os.path.join(self.tmpdir, 'corpus.txt.gz'), os.path.join(self.tmpdir, 'corpus.txt.bz2')]
+
+        with open(fns[0], 'wb') as f:
+            f.write(CORPUS.encode('utf8'))
+        f = gzip.open(fns[1], 'wb')
+        f.write(CORPUS.encode('utf8'))
+        f.close()
+        f = bz2.BZ2File(fns[2], 'wb')
+        f.write(CORPUS.encode('utf8'))
+        f.close()
+
+        outfn = os.path.join(self.tmpdir, 'tokens.txt')
+
+        self.assertEqual (main(['-o', outfn, '-w', '2', '-c', '1'] + fns), 0)
+
+        with io.open(outfn, 'r', encoding='utf8') as f:
+            self.assertEqual (f.read(), TOKENS * 3)
+
+if __name__ == "__main__":
+
+    logging.basicConfig(level=logging.ERROR)
+    
+    unittest.main()
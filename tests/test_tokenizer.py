@@ -70,6 +70,61 @@ class TestTokenizer (unittest.TestCase):
 
         self.assertEqual (tokenize(u"Mein Name ist HAL 9000."), [u'mein', u'name', u'ist', u'hal', u'neuntausend'])
 
+    def test_compiled_replacements(self):
+
+        table = [ (u'd.h.' , u'das heißt '),
+                  (u'Ziff.', u'ziffer '),
+                  (u'Mrd.' , u'milliarden '),
+                  (u'GHz'  , u'gigahertz '),
+                  (u'\xa0' , u' '),
+                  (u'\xa020', u' ') ]
+
+        for s in [u"Mrd.h. Mrd. d.h.", u"GHZiff. GHz", u"a\xa020 b"]:
+
+            res = s
+            for srch, repl in table:
+                res = res.replace(srch, repl)
+
+            self.assertEqual (apply_replacements(compile_replacements(table), s), res)
+
+        s = u"Abk. bzw. d. h. Mrd.h. z.B. GHz, s.o.k. „foo“ & \xa020 $5"
+        res = s
+        for srch, repl in symb_abbrev_norm:
+            res = res.replace(srch, repl)
+        self.assertEqual (apply_replacements(symb_abbrev_norm_compiled, s), res)
+
+    def test_tokenize_many(self):
+
+        sentences = [u"Mein Name ist HAL %d." % i for i in range(50)]
+
+        res = [tokenize(s) for s in sentences]
+
+        self.assertEqual (list(tokenize_many(sentences, workers=2, chunksize=7)), res)
+        self.assertEqual (list(tokenize_many(iter(sentences), workers=1)), res)
+
+        res = [tokenize(s, lang='en', keep_punctuation=True) for s in sentences]
+
+        self.assertEqual (list(tokenize_many(sentences, lang='en', keep_punctuation=True, workers=3, chunksize=4)), res)
+
+    def test_cache(self):
+
+        enable_cache(maxsize=2)
+
+        try:
+            self.assertEqual (tokenize(u"Hallo Welt"), (u'hallo', u'welt'))
+            self.assertEqual (tokenize(u"Hallo Welt"), (u'hallo', u'welt'))
+            self.assertEqual (tokenize(u"Hallo Welt", lang='en'), (u'hallo', u'welt'))
+            self.assertEqual (tokenize(u"Hallo, Welt", keep_punctuation=True), (u'hallo', u',', u'welt'))
+
+            self.assertEqual (cache_info(), CacheInfo(hits=1, misses=3, evictions=1, maxsize=2, currsize=2))
+
+            cache_clear()
+            self.assertEqual (cache_info().currsize, 0)
+        finally:
+            disable_cache()
+
+        self.assertEqual (tokenize(u"Hallo Welt"), [u'hallo', u'welt'])
+
     def test_ws(self):
         self.assertEqual (compress_ws('   ws   foo bar'), ' ws foo bar')
 
@@ -95,6 +150,29 @@ class TestTokenizer (unittest.TestCase):
             if u in wrt:
                 self.assertEqual (z, wrt[u])
 
+    def test_wrt(self):
+
+        table = load_wrt(WRT_DE_FN)
+
+        self.assertEqual (len(table), len(wrt))
+        self.assertEqual (wrt[u'zuerich'], u'zürich')
+        self.assertEqual (table[u'swr3'], u'swr drei')
+        self.assertTrue  (wrt.loaded)
+
+    def test_number_tables(self):
+
+        self.assertEqual (zahl_in_worten(0, z=True), u'')
+        self.assertEqual (zahl_in_worten(1, s=False), u'ein')
+        self.assertEqual (zahl_in_worten(1, s=False, e=True), u'eine')
+        self.assertEqual (zahl_in_worten(2234567), u'zweimillionenzweihundertvierunddreißigtausendfünfhundertsiebenundsechzig')
+        self.assertEqual (nombre_en_mots(2234567), u'deux millions deux cent trente-quatre mille cinq cent soixante-sept')
+        self.assertEqual (num2words_en(42), u'forty-two')
+
+        # only small numbers are kept in the tables
+        self.assertTrue  ((567, True, True, False) in zahl_in_worten_table)
+        self.assertFalse ((2234567, True, False, False) in zahl_in_worten_table)
+        self.assertFalse ((2234567, False) in nombre_en_mots_table)
+
     def test_kill_umlauts(self):
         self.assertEqual (kill_umlauts(u'Ü ü Ö ö Ä ä ß'), 'Ue ue Oe oe Ae ae ss')
 
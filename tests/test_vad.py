@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*- 
+
+#
+# Copyright 2018 Guenter Bartsch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import random
+import unittest
+import logging
+
+import numpy as np
+
+from nltools.vad import VAD, VADPool, SAMPLE_RATE, BUFFER_DURATION, STATE_IDLE, STATE_PRE_SPEECH, STATE_PRE_GAP, \
+                        STATE_SPEECH, STATE_GAP, STATE_IGNORE, STATE_IGNORE_GAP
+
+FRAME_LEN = SAMPLE_RATE * BUFFER_DURATION // 1000
+
+def speech_frame():
+
+    # harmonic signal, classified as speech by webrtcvad
+    t = np.arange(FRAME_LEN) / float(SAMPLE_RATE)
+    return (sum(np.sin(2 * np.pi * 150 * k * t) / k for k in range(1, 20)) * 4000).astype(np.int16)
+
+def silence_frame():
+    return np.zeros(FRAME_LEN, dtype=np.int16)
+
+#
+# reference: the original list based VAD state machine, every frame is kept
+#
+
+class ListVAD(object):
+
+    def __init__(self, vad):
+
+        self.state           = STATE_IDLE
+        self.buf             = []
+        self.buf_sent        = 0
+
+        self.min_buf_entries = vad.min_buf_entries
+        self.max_buf_entries = vad.max_buf_entries
+        self.max_gap         = vad.max_gap
+
+    def _return_audio (self, finalize):
+
+        res = self.buf[self.buf_sent:]
+        self.buf_sent = len(self.buf)
+
+        return np.concatenate(res) if res else np.zeros(0, dtype=np.int16), finalize
+
+    def process_frame (self, frame, vad_res):
+
+        if self.state == STATE_IDLE:
+            if vad_res:
+                self.state    = STATE_PRE_SPEECH
+                self.buf      = [ frame ]
+                self.buf_sent = 0
+            return None, False
+
+        self.buf.append(frame)
+
+        if self.state == STATE_PRE_SPEECH:
+            if vad_res:
+                if len(self.buf) > self.min_buf_entries:
+                    self.state = STATE_SPEECH
+            else:
+                self.state     = STATE_PRE_GAP
+                self.gap_start = len(self.buf)
+
+        elif self.state == STATE_PRE_GAP:
+            if vad_res:
+                self.state = STATE_PRE_SPEECH
+            elif len(self.buf) - self.gap_start > self.max_gap:
+                self.state = STATE_IDLE
+
+        elif self.state == STATE_SPEECH:
+            if len(self.buf) > self.max_buf_entries:
+                self.state = STATE_IGNORE
+                return self._return_audio(True)
+            if not vad_res:
+                self.state     = STATE_GAP
+                self.gap_start = len(self.buf)
+            return self._return_audio(False)
+
+        elif self.state == STATE_GAP:
+            if vad_res:
+                self.state = STATE_SPEECH
+                return self._return_audio(False)
+            if len(self.buf) - self.gap_start > self.max_gap:
+                self.state = STATE_IDLE
+                return self._return_audio(True)
+            return self._return_audio(False)
+
+        elif self.state == STATE_IGNORE:
+            if not vad_res:
+                self.state     = STATE_IGNORE_GAP
+                self.gap_start = len(self.buf)
+
+        elif self.state == STATE_IGNORE_GAP:
+            if vad_res:
+                self.state = STATE_IGNORE
+            elif len(self.buf) - self.gap_start > self.max_gap:
+                self.state = STATE_IDLE
+
+        return None, False
+
+class TestVAD (unittest.TestCase):
+
+    def test_utterance(self):
+
+        vad = VAD()
+
+        frames = [silence_frame()] * 10 + [speech_frame()] * 50 + [silence_frame()] * 50
+
+        utt      = []
+        finalize = False
+        for frame in frames:
+            audio, finalize = vad.process_audio(frame)
+            if audio is None:
+                continue
+            self.assertTrue (isinstance(audio, np.ndarray))
+            self.assertEqual (audio.dtype, np.int16)
+            utt.append(audio.copy())
+            if finalize:
+                break
+
+        self.assertTrue (finalize)
+
+        utt = np.concatenate(utt)
+
+        # whole utterance, starting with the first speech frame
+        self.assertTrue (len(utt) >= 50 * FRAME_LEN)
+        self.assertEqual (len(utt) % FRAME_LEN, 0)
+        self.assertTrue ((utt[:FRAME_LEN] == speech_frame()).all())
+
+    def test_silence(self):
+
+        vad = VAD()
+
+        for i in range(100):
+            audio, finalize = vad.process_audio(silence_frame())
+            self.assertEqual (audio, None)
+            self.assertFalse (finalize)
+
+    def test_flush(self):
+
+        vad = VAD()
+
+        for i in range(30):
+            audio, finalize = vad.process_audio(speech_frame())
+
+        audio, finalize = vad.flush()
+        self.assertTrue (finalize)
+        self.assertEqual (len(audio), 0)
+
+        audio, finalize = vad.flush()
+        self.assertEqual (audio, None)
+
+    def test_ring_buffer(self):
+
+        vad = VAD(max_utt_length=1.2)
+
+        # capacity: max_utt_length + 1 frame
+        self.assertEqual (len(vad.buf), 41 * FRAME_LEN)
+
+        # utterance exceeding max_utt_length is cut, ignored audio is not stored
+
+        utt = 0
+        for i in range(1000):
+            audio, finalize = vad.process_audio(speech_frame())
+            if audio is not None:
+                utt += len(audio)
+            self.assertTrue (vad.buf_len <= len(vad.buf))
+
+        self.assertEqual (utt, 41 * FRAME_LEN)
+        self.assertEqual (vad.buf_frames, 1000)
+
+        frames = [ np.full(FRAME_LEN, i, dtype=np.int16) for i in range(50) ]
+
+        # sent frames are dropped when the buffer is full
+
+        vad._start_utterance()
+        for frame in frames[:41]:
+            vad._append(frame)
+        audio, finalize = vad._return_audio(False)
+        self.assertEqual (len(audio), 41 * FRAME_LEN)
+        vad._append(frames[41])
+        audio, finalize = vad._return_audio(False)
+        self.assertTrue ((audio == frames[41]).all())
+
+        # unsent frames are never dropped, the buffer grows instead
+
+        vad._start_utterance()
+        for frame in frames:
+            vad._append(frame)
+        audio, finalize = vad._return_audio(False)
+        self.assertTrue ((audio == np.concatenate(frames)).all())
+
+        # and shrinks back for the next utterance
+
+        vad._start_utterance()
+        self.assertEqual (len(vad.buf), 41 * FRAME_LEN)
+
+    def _compare(self, vad, vad_res):
+
+        ref = ListVAD(vad)
+
+        for i, res in enumerate(vad_res):
+
+            frame = np.full(FRAME_LEN, i % 30000, dtype=np.int16)
+
+            audio, finalize         = vad._process_frame(frame, res)
+            ref_audio, ref_finalize = ref.process_frame(frame, res)
+
+            self.assertEqual (finalize, ref_finalize)
+            if ref_audio is None:
+                self.assertIsNone (audio)
+            else:
+                self.assertTrue (np.array_equal(audio, ref_audio))
+
+    def test_list_reference(self):
+
+        # long pre speech phase: speech alternating with silence, far
+        # longer than max_utt_length before speech is detected
+
+        vad_res = [False] * 5 + [True, False] * 30 + [True] * 60 + [False] * 40
+        self._compare(VAD(max_utt_length=1.2), vad_res)
+
+        rnd = random.Random(42)
+        for i in range(20):
+            p       = rnd.random()
+            vad_res = [ rnd.random() < p for j in range(2000) ]
+            self._compare(VAD(max_utt_length=rnd.choice([0.6, 1.2, 3])), vad_res)
+
+    def test_pool(self):
+
+        pool = VADPool(idle_timeout=10)
+
+        # stream 'a' speaks, stream 'b' stays silent
+
+        utt = {}
+        fin = {}
+        now = 0.0
+        for i in range(120):
+            frames = [ ('a', speech_frame() if 10 <= i < 60 else silence_frame()),
+                       ('b', silence_frame()) ]
+            for e in pool.process_frames(frames, now=now):
+                utt.setdefault(e.stream_id, []).append(e.audio.copy())
+                if e.finalize:
+                    fin[e.stream_id] = True
+            now += BUFFER_DURATION / 1000.0
+
+        self.assertEqual (set(utt.keys()), set(['a']))
+        self.assertTrue (fin['a'])
+        self.assertTrue (len(np.concatenate(utt['a'])) >= 50 * FRAME_LEN)
+        self.assertEqual (len(pool), 2)
+
+        # idle streams are evicted, utterances in progress are finalized
+
+        for i in range(30):
+            events = pool.process_frames([('c', speech_frame())], now=now)
+            now += BUFFER_DURATION / 1000.0
+        self.assertEqual (len(pool), 3)
+
+        events = pool.process_frames([('a', silence_frame())], now=now+10.0)
+        self.assertEqual (len(pool), 1)
+        self.assertTrue ('a' in pool)
+        self.assertEqual ([ (e.stream_id, e.finalize) for e in events ], [('c', True)])
+
+        # max_streams: least recently used stream is evicted
+
+        pool = VADPool(max_streams=2)
+        pool.process_frames([('a', silence_frame()), ('b', silence_frame())], now=0.0)
+        pool.process_frames([('a', silence_frame())], now=1.0)
+        pool.process_frames([('c', silence_frame())], now=2.0)
+        self.assertEqual (sorted(pool.streams.keys()), ['a', 'c'])
+
+        self.assertEqual (pool.close_stream('a'), [])
+        self.assertEqual (list(pool.streams.keys()), ['c'])
+
+if __name__ == "__main__":
+
+    logging.basicConfig(level=logging.ERROR)
+    
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*- 
+
+#
+# Copyright 2018 Guenter Bartsch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+import logging
+import tempfile
+import shutil
+import wave
+import os
+
+import numpy as np
+
+from nltools.vad         import VAD, SAMPLE_RATE, BUFFER_DURATION
+from nltools.vad_segment import main
+
+FRAME_LEN = SAMPLE_RATE * BUFFER_DURATION // 1000
+
+T      = np.arange(FRAME_LEN) / float(SAMPLE_RATE)
+SPEECH = (sum(np.sin(2 * np.pi * 150 * k * T) / k for k in range(1, 20)) * 4000).astype(np.int16)
+SIL    = np.zeros(FRAME_LEN, dtype=np.int16)
+
+def write_wav(wavfn, frames=None):
+
+    # default: 1s silence, 3s speech, 2s silence, 2s speech, 1s silence
+
+    if frames is None:
+        frames = [SIL] * 33 + [SPEECH] * 100 + [SIL] * 67 + [SPEECH] * 67 + [SIL] * 33
+
+    wavf = wave.open(wavfn, 'wb')
+    wavf.setnchannels(1)
+    wavf.setsampwidth(2)
+    wavf.setframerate(SAMPLE_RATE)
+    wavf.writeframes(np.concatenate(frames).tobytes())
+    wavf.close()
+
+class TestVADSegment (unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_segment_file(self):
+
+        wavfn = os.path.join(self.tmpdir, 'foo.wav')
+        write_wav(wavfn)
+
+        segments = list(VAD().segment_file(wavfn))
+
+        self.assertEqual (len(segments), 2)
+        self.assertEqual (segments[0][0], 33 * FRAME_LEN)
+        self.assertTrue  (segments[0][1] >= 133 * FRAME_LEN)
+        self.assertEqual (segments[1][0], 200 * FRAME_LEN)
+
+        with self.assertRaises(Exception):
+            VAD(sample_rate=8000).segment_file(wavfn)
+
+    def test_ends_at_speech_detection(self):
+
+        # file ends on the very frame speech is detected, no audio has been
+        # returned by process_audio() before flush()
+
+        vad   = VAD()
+        n     = vad.min_buf_entries + 1
+        wavfn = os.path.join(self.tmpdir, 'wav', 'a.wav')
+
+        os.mkdir(os.path.join(self.tmpdir, 'wav'))
+        write_wav(wavfn, [SIL] * 33 + [SPEECH] * n)
+
+        self.assertEqual (list(vad.segment_file(wavfn)), [(33 * FRAME_LEN, (33 + n) * FRAME_LEN)])
+
+        outdir = os.path.join(self.tmpdir, 'seg')
+
+        self.assertEqual (main(['-o', outdir, wavfn]), 0)
+
+        wavf = wave.open(os.path.join(outdir, 'a-0000.wav'), 'rb')
+        self.assertEqual (wavf.getnframes(), n * FRAME_LEN)
+        wavf.close()
+
+    def test_vad_segment(self):
+
+        os.mkdir(os.path.join(self.tmpdir, 'wav'))
+        write_wav(os.path.join(self.tmpdir, 'wav', 'a.wav'))
+        write_wav(os.path.join(self.tmpdir, 'wav', 'b.wav'))
+
+        outdir = os.path.join(self.tmpdir, 'seg')
+
+        self.assertEqual (main(['-o', outdir, '-w', '2', os.path.join(self.tmpdir, 'wav')]), 0)
+
+        self.assertEqual (sorted(os.listdir(outdir)), ['a-0000.wav', 'a-0001.wav', 'b-0000.wav', 'b-0001.wav'])
+
+        wavf = wave.open(os.path.join(outdir, 'a-0001.wav'), 'rb')
+        self.assertEqual (wavf.getframerate(), SAMPLE_RATE)
+        self.assertTrue  (wavf.getnframes() >= 67 * FRAME_LEN)
+        wavf.close()
+
+        self.assertEqual (main([os.path.join(self.tmpdir, 'missing.wav')]), 1)
+
+if __name__ == "__main__":
+
+    logging.basicConfig(level=logging.ERROR)
+    
+    unittest.main()
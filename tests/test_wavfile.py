@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*- 
+
+#
+# Copyright 2018 Guenter Bartsch
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import wave
+import struct
+import shutil
+import tempfile
+import unittest
+import logging
+
+import numpy as np
+
+from nltools.wavfile import mmap_wav
+
+class TestWavFile (unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write_wav(self, samples, data_size=None):
+
+        wavfn = os.path.join(self.tmpdir, 'a.wav')
+
+        wavf = wave.open(wavfn, 'wb')
+        wavf.setnchannels(1)
+        wavf.setsampwidth(2)
+        wavf.setframerate(16000)
+        wavf.writeframes(samples.astype('<i2').tobytes())
+        wavf.close()
+
+        # patch the data chunk size, like a streaming writer would leave it
+
+        if data_size is not None:
+            with open(wavfn, 'r+b') as f:
+                f.seek(40)
+                f.write(struct.pack('<I', data_size))
+
+        return wavfn
+
+    def test_mmap_wav(self):
+
+        samples = np.arange(-500, 500, dtype=np.int16)
+
+        res, sample_rate = mmap_wav(self._write_wav(samples))
+        self.assertEqual (sample_rate, 16000)
+        self.assertTrue ((res == samples).all())
+
+        # data size smaller than the file: trailing bytes are not samples
+
+        res, sample_rate = mmap_wav(self._write_wav(samples, 200))
+        self.assertTrue ((res == samples[:100]).all())
+
+    def test_unset_data_size(self):
+
+        samples = np.arange(1000, dtype=np.int16)
+
+        for data_size in (0, 0xFFFFFFFF):
+            res, sample_rate = mmap_wav(self._write_wav(samples, data_size))
+            self.assertTrue ((res == samples).all())
+
+        res, sample_rate = mmap_wav(self._write_wav(np.zeros(0, dtype=np.int16), 0))
+        self.assertEqual (len(res), 0)
+
+    def test_not_a_wav(self):
+
+        wavfn = os.path.join(self.tmpdir, 'a.wav')
+        with open(wavfn, 'wb') as f:
+            f.write(b'\0' * 100)
+
+        with self.assertRaises(Exception):
+            mmap_wav(wavfn)
+
+if __name__ == "__main__":
+
+    logging.basicConfig(level=logging.ERROR)
+
+    unittest.main()